@@ -0,0 +1,113 @@
+"""
+Pool of SimpleSpellChecker instances for several languages
+Checkers are created on first use per (language, case sensitivity) and at
+most `max_resident` stay loaded, optionally also within `max_bytes` of
+dictionary memory; beyond that the least recently used are evicted. Each
+key has its own load lock, so concurrent first uses of a language load it
+once while other languages keep loading and serving in parallel.
+"""
+
+import threading
+from collections import OrderedDict
+
+from simple_spellchecker import SimpleSpellChecker
+
+
+class CheckerPool:
+    """Thread-safe LRU pool of loaded checkers
+
+    Args:
+        max_resident (int): Checkers kept loaded at most
+        max_bytes (int): Optional budget for the summed memory_footprint()
+            of the resident checkers
+        dictionaries (dict): Optional language -> compiled dictionary file,
+            memory-mapped instead of parsing the bundled dictionary
+        factory (callable): Builds an unloaded checker; defaults to
+            SimpleSpellChecker
+    """
+
+    def __init__(self, max_resident=3, max_bytes=None, dictionaries=None, factory=SimpleSpellChecker):
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+        self.max_resident = max_resident
+        self.max_bytes = max_bytes
+        self.dictionaries = dict(dictionaries or {})
+        self.factory = factory
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self._resident = OrderedDict()
+        self._footprints = {}
+
+    def get(self, language='en', case_sensitive=False):
+        """Return the loaded checker of a language, loading it on first use"""
+        key = (language, case_sensitive)
+        with self._lock:
+            checker = self._touch(key)
+            if checker is not None:
+                return checker
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Only one thread loads a key; the others wait here and find it resident
+        with load_lock:
+            with self._lock:
+                checker = self._touch(key)
+                if checker is not None:
+                    return checker
+            checker = self.factory(dictionary=self.dictionaries.get(language), language=language,
+                                   case_sensitive=case_sensitive).warm()
+            footprint = checker.memory_footprint()
+            with self._lock:
+                self._resident[key] = checker
+                self._footprints[key] = footprint
+                self.loads += 1
+                self._evict(keep=key)
+        return checker
+
+    def known(self, words, language='en', case_sensitive=False):
+        """known() of the language's checker"""
+        return self.get(language, case_sensitive).known(words)
+
+    def _touch(self, key):
+        """Resident checker of `key` marked most recently used, or None (lock held)"""
+        checker = self._resident.get(key)
+        if checker is not None:
+            self._resident.move_to_end(key)
+            self.hits += 1
+        return checker
+
+    def _evict(self, keep):
+        """Drop least recently used checkers until within the limits (lock held)
+
+        The checker just loaded is kept even if it alone exceeds max_bytes.
+        """
+        while len(self._resident) > 1 and (len(self._resident) > self.max_resident or
+                                           (self.max_bytes is not None and self.footprint() > self.max_bytes)):
+            key = next(iter(self._resident))
+            if key == keep:
+                break
+            del self._resident[key]
+            del self._footprints[key]
+            self.evictions += 1
+
+    def footprint(self):
+        """Summed memory footprint of the resident checkers in bytes"""
+        return sum(self._footprints.values())
+
+    def resident(self):
+        """Keys of the resident checkers, least recently used first"""
+        with self._lock:
+            return list(self._resident)
+
+    def stats(self):
+        """Return the pool counters as a dict"""
+        with self._lock:
+            return {
+                'resident': len(self._resident),
+                'footprint': self.footprint(),
+                'hits': self.hits,
+                'loads': self.loads,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,214 @@
+"""
+Compact memory-mapped dictionary for fast checker startup
+A dictionary is compiled once into a binary file holding a sorted string
+table, an open-addressing hash index over it and a frequency array. Loading
+it only maps the file: lookups hash the word and probe the index in place,
+so nothing is decompressed or parsed and the pages are shared by every
+process mapping the same file.
+
+File layout (little-endian, sections 8-byte aligned):
+    header       magic, word count, index slots, longest word length,
+                 letters length, string table length, total words
+    frequencies  uint64[count], in string table order
+    offsets      uint32[count + 1], start of each word in the string table
+    index        uint32[slots], word number + 1 (0 = empty slot)
+    strings      UTF-8 words, sorted
+    letters      UTF-8 letters of the corpus
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections.abc import Mapping
+
+from spellchecker import SpellChecker
+from spellchecker.spellchecker import WordFrequency
+
+MAGIC = b'SPDICT\x00\x01'
+HEADER = struct.Struct('<8sIIIIQQ')
+
+
+def _slot(encoded, mask):
+    return zlib.crc32(encoded) & mask
+
+
+def _align(data):
+    return data + b'\x00' * (-len(data) % 8)
+
+
+def compile_dictionary(path, language='en'):
+    """Write the dictionary of `language` to `path` in the compiled format
+
+    Returns:
+        int: Number of words written
+    """
+    source = SpellChecker(language=language).word_frequency
+    words = sorted(source.dictionary)
+    encoded = [w.encode('utf-8') for w in words]
+
+    offsets = array('I', [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    frequencies = array('Q', (source.dictionary[w] for w in words))
+
+    # At most half full, so probe sequences stay short
+    slots = 1
+    while slots < 2 * len(words):
+        slots *= 2
+    index = array('I', bytes(4 * slots))
+    for number, e in enumerate(encoded):
+        slot = _slot(e, slots - 1)
+        while index[slot]:
+            slot = (slot + 1) & (slots - 1)
+        index[slot] = number + 1
+
+    for table in (offsets, frequencies, index):
+        if sys.byteorder != 'little':
+            table.byteswap()
+    strings = b''.join(encoded)
+    letters = ''.join(sorted(source.letters)).encode('utf-8')
+    header = HEADER.pack(MAGIC, len(words), slots, source.longest_word_length,
+                         len(letters), len(strings), source.total_words)
+    with open(path, 'wb') as f:
+        for section in (header, frequencies.tobytes(), offsets.tobytes(), index.tobytes(), strings, letters):
+            f.write(_align(section))
+    return len(words)
+
+
+class ReadOnlyWordFrequency(WordFrequency):
+    """WordFrequency whose methods that would change the dictionary raise TypeError"""
+
+    read_only_message = "The word-frequency store is read-only"
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(self.read_only_message)
+
+    pop = _read_only
+    load_dictionary = _read_only
+    load_json = _read_only
+    load_text_file = _read_only
+    load_text = _read_only
+    load_words = _read_only
+    add = _read_only
+    remove_words = _read_only
+    remove = _read_only
+    remove_by_threshold = _read_only
+    _update_dictionary = _read_only
+
+
+class MappedDictionary(Mapping):
+    """Read-only word -> frequency mapping over a memory-mapped compiled file
+
+    Args:
+        path (str): File written by compile_dictionary()
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise OSError("Compiled dictionaries are only readable on little-endian machines")
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self._count, slots, self.longest_word_length, letters_len,
+         strings_len, self.total_words) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compiled dictionary")
+        self._mask = slots - 1
+
+        view = memoryview(self._map)
+        start = HEADER.size
+        sections = []
+        for size in (8 * self._count, 4 * (self._count + 1), 4 * slots, strings_len, letters_len):
+            sections.append(view[start:start + size])
+            start += size + (-size % 8)
+        frequencies, offsets, index, self._strings, letters = sections
+        self._frequencies = frequencies.cast('Q')
+        self._offsets = offsets.cast('I')
+        self._index = index.cast('I')
+        self.letters = frozenset(bytes(letters).decode('utf-8'))
+
+    @property
+    def nbytes(self):
+        """Size of the mapped file"""
+        return len(self._map)
+
+    def _number(self, word):
+        """Position of `word` in the string table, or -1"""
+        if not isinstance(word, str):
+            return -1
+        encoded = word.encode('utf-8', 'surrogatepass')
+        slot = _slot(encoded, self._mask)
+        while True:
+            entry = self._index[slot]
+            if not entry:
+                return -1
+            number = entry - 1
+            if self._strings[self._offsets[number]:self._offsets[number + 1]] == encoded:
+                return number
+            slot = (slot + 1) & self._mask
+
+    def _word(self, number):
+        return bytes(self._strings[self._offsets[number]:self._offsets[number + 1]]).decode('utf-8')
+
+    def __contains__(self, word):
+        return self._number(word) >= 0
+
+    def __getitem__(self, word):
+        # Like the Counter of a loaded dictionary, missing words count 0
+        number = self._number(word)
+        return self._frequencies[number] if number >= 0 else 0
+
+    def get(self, word, default=None):
+        number = self._number(word)
+        return self._frequencies[number] if number >= 0 else default
+
+    def __iter__(self):
+        for number in range(self._count):
+            yield self._word(number)
+
+    def __len__(self):
+        return self._count
+
+
+class MappedWordFrequency(ReadOnlyWordFrequency):
+    """Read-only WordFrequency backed by a compiled dictionary file"""
+
+    read_only_message = "A compiled dictionary is read-only"
+
+    def __init__(self, path, case_sensitive=False):
+        super().__init__(case_sensitive=case_sensitive)
+        self._dictionary = MappedDictionary(path)
+        self._total_words = self._dictionary.total_words
+        self._unique_words = len(self._dictionary)
+        self._letters = self._dictionary.letters
+        self._longest_word_length = self._dictionary.longest_word_length
+        self.path = path
+
+
+def load_checker(path, case_sensitive=False):
+    """SpellChecker whose dictionary is the memory-mapped compiled file at `path`"""
+    checker = SpellChecker(language=None, case_sensitive=case_sensitive)
+    checker._word_frequency = MappedWordFrequency(path, case_sensitive)
+    return checker
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a pyspellchecker dictionary for memory-mapped loading")
+    parser.add_argument('output', help='Path of the compiled dictionary file')
+    parser.add_argument('--language', default='en', help='Dictionary language (default: en)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = compile_dictionary(args.output, args.language)
+    print(f"Compiled {count} words to {args.output} in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    SpellChecker(language=args.language)
+    parsed = time.perf_counter() - start
+    start = time.perf_counter()
+    load_checker(args.output)
+    mapped = time.perf_counter() - start
+    print(f"Startup: {parsed * 1000:.1f} ms parsing the JSON dictionary, {mapped * 1000:.2f} ms mapping the compiled file")
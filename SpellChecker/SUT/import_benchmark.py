@@ -0,0 +1,55 @@
+"""
+Import-time benchmark for simple_spellchecker
+Imports the module and constructs a checker in fresh interpreters, and fails
+when the median cost exceeds IMPORT_BUDGET_MS or when pyspellchecker itself
+is imported before the first lookup. Interpreter startup is not counted.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Budget for `import simple_spellchecker` plus SimpleSpellChecker()
+IMPORT_BUDGET_MS = 10.0
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import simple_spellchecker
+simple_spellchecker.SimpleSpellChecker()
+elapsed = time.perf_counter() - start
+print(elapsed * 1000, 'spellchecker' in sys.modules)
+"""
+
+
+def measure(runs=10):
+    """Return the import-plus-construction times (ms) of `runs` fresh interpreters
+
+    Raises AssertionError if any run imported pyspellchecker eagerly.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE], cwd=here, check=True,
+                                capture_output=True, text=True).stdout.split()
+        assert output[1] == 'False', "simple_spellchecker imported pyspellchecker eagerly"
+        times.append(float(output[0]))
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the import time of simple_spellchecker")
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters to measure (default: 10)')
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS,
+                        help=f'Budget in ms (default: {IMPORT_BUDGET_MS:g})')
+    args = parser.parse_args()
+
+    times = measure(args.runs)
+    median = statistics.median(times)
+    print(f"import + construct: median {median:.2f} ms, max {max(times):.2f} ms "
+          f"over {len(times)} runs (budget {args.budget:g} ms)")
+    if median > args.budget:
+        print("Over budget")
+        sys.exit(1)
@@ -1,16 +1,99 @@
 """
 Simplified wrapper for testing the pyspellchecker known() method.
 Original source: https://github.com/barrust/pyspellchecker
+
+pyspellchecker and the dictionary are loaded on first use, so importing
+this module and constructing a checker stay cheap (see import_benchmark.py).
 """
 
-from spellchecker import SpellChecker
+import sys
+from collections import OrderedDict
+from itertools import islice
+
+# Tokens passed to SpellChecker.known() at once by known_iter()
+CHUNK_SIZE = 10_000
+
+# Raw tokens remembered by known_batch()
+CACHE_SIZE = 100_000
+
+
+class TokenCache:
+    """Bounded LRU cache from raw token to (normalized word, known verdict)"""
+    
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def get(self, token):
+        """Return the cached (word, known) of a token, or None"""
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(token)
+        return entry
+    
+    def put(self, token, entry):
+        """Remember a token's entry, evicting the least recently used beyond maxsize"""
+        self._entries[token] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def stats(self):
+        """Return the (hits, misses) counters"""
+        return self.hits, self.misses
+    
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 
 class SimpleSpellChecker:
     """Wrapper class for testing known() method"""
     
-    def __init__(self):
-        """Initialize with English dictionary"""
-        self.spell = SpellChecker(language='en')
+    def __init__(self, cache_size=CACHE_SIZE, dictionary=None, language='en', case_sensitive=False):
+        """
+        Initialize with English dictionary, loaded on first use or by warm().
+        
+        Args:
+            cache_size (int): Raw tokens remembered by known_batch()
+            dictionary (str): Optional compiled dictionary file (see
+                compiled_dictionary.py), memory-mapped instead of parsing
+                the bundled JSON dictionary
+            language (str): Dictionary language of pyspellchecker
+            case_sensitive (bool): Whether lookups keep the case of words
+        """
+        self.language = language
+        self.case_sensitive = case_sensitive
+        self.dictionary = dictionary
+        self._spell = None
+        self.cache = TokenCache(cache_size)
+        self.tokens_seen = 0
+        self.duplicates = 0
+    
+    @property
+    def spell(self):
+        """The wrapped SpellChecker, loading the dictionary on first use"""
+        if self._spell is None:
+            if self.dictionary is None:
+                from spellchecker import SpellChecker
+                self._spell = SpellChecker(language=self.language, case_sensitive=self.case_sensitive)
+            else:
+                from compiled_dictionary import load_checker
+                self._spell = load_checker(self.dictionary, self.case_sensitive)
+        return self._spell
+    
+    def warm(self):
+        """Load the dictionary now rather than on the first lookup, returning self"""
+        self.spell
+        return self
     
     def known(self, words):
         """
@@ -24,6 +107,101 @@ class SimpleSpellChecker:
         """
         return self.spell.known(words)
     
+    def known_iter(self, words, chunk_size=CHUNK_SIZE):
+        """
+        Yield the known words of a token stream, one chunk at a time.
+        
+        Only `chunk_size` tokens are held at once, so memory is bounded by
+        the chunk size rather than the input size. Words are unique within
+        a chunk but may repeat across chunks; collect them with set() for
+        the same result as known().
+        
+        Args:
+            words (iterable): Any iterable or generator of words
+            chunk_size (int): Number of tokens checked per chunk
+            
+        Yields:
+            str: Words that are in the dictionary
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        tokens = iter(words)
+        while True:
+            chunk = list(islice(tokens, chunk_size))
+            if not chunk:
+                return
+            yield from self.spell.known(chunk)
+    
+    def known_batch(self, words):
+        """
+        Batched known(): deduplicate tokens and cache their verdicts.
+        
+        Each distinct token of the batch is looked up once in the token
+        cache; only tokens missing from it are normalized and checked
+        against the dictionary. Returns the same set as known().
+        
+        Args:
+            words (iterable): Words to check
+            
+        Returns:
+            set: Set of words that are in the dictionary
+        """
+        from spellchecker.utils import ensure_unicode
+        
+        result = set()
+        misses = []
+        words = list(words)
+        self.tokens_seen += len(words)
+        unique = dict.fromkeys(words)
+        self.duplicates += len(words) - len(unique)
+        for token in unique:
+            entry = self.cache.get(token)
+            if entry is None:
+                misses.append(token)
+            elif entry[1]:
+                result.add(entry[0])
+        if misses:
+            found = self.spell.known(misses)
+            for token in misses:
+                word = ensure_unicode(token)
+                if not self.spell._case_sensitive:
+                    word = word.lower()
+                self.cache.put(token, (word, word in found))
+            result |= found
+        return result
+    
+    def cache_stats(self):
+        """
+        Return the known_batch() counters as a dict.
+        
+        Counts are per token: 'hits' are tokens answered without a dictionary
+        lookup, either as a repeat within their batch ('duplicates') or from
+        the token cache, and 'misses' the tokens that were looked up, so
+        hits + misses == tokens.
+        """
+        hits, misses = self.cache.stats()
+        hits += self.duplicates
+        return {
+            'tokens': self.tokens_seen,
+            'duplicates': self.duplicates,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / self.tokens_seen if self.tokens_seen else 0.0,
+            'cached': len(self.cache),
+        }
+    
+    def memory_footprint(self):
+        """Approximate bytes held by the dictionary, 0 while it is not loaded
+        
+        A memory-mapped dictionary counts the size of its mapping.
+        """
+        if self._spell is None:
+            return 0
+        dictionary = self._spell.word_frequency.dictionary
+        if hasattr(dictionary, 'nbytes'):
+            return dictionary.nbytes
+        return sys.getsizeof(dictionary) + sum(sys.getsizeof(w) + sys.getsizeof(n) for w, n in dictionary.items())
+    
     def get_dictionary_size(self):
         """Return number of words in dictionary"""
         return self.spell.word_frequency.unique_words
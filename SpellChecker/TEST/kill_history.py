@@ -0,0 +1,68 @@
+"""
+Kill history of metamorphic test groups across mutation runs
+Full runs record how often each MG violated its MR; fail-fast runs use those
+rates to try the most likely killer of a mutant first.
+"""
+
+import json
+import os
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kill_history.json')
+
+
+def load_history(path=HISTORY_FILE):
+    """Return {mr_name: {group_num: [kills, trials]}}, empty if no history exists"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    return {mr_name: {int(num): counts for num, counts in groups.items()}
+            for mr_name, groups in data.items()}
+
+
+def save_history(history, path=HISTORY_FILE):
+    """Write the history back to disk"""
+    with open(path, 'w') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+
+
+def is_group_violation(violation):
+    """True for violations of a test group, False for outcomes such as a watchdog timeout"""
+    return violation.startswith('MG')
+
+
+def group_number(violation):
+    """Group number of a violation label such as 'MG3' or 'MG3 (Error)'"""
+    return int(violation.split()[0][2:])
+
+
+def record_run(history, mr_name, group_count, violations_by_mutant):
+    """Add one full run of an MR to the history
+
+    Args:
+        history (dict): History as returned by load_history()
+        mr_name (str): MR that was run
+        group_count (int): Number of test groups in the MR
+        violations_by_mutant (dict): Violation labels per mutant from that run
+    """
+    groups = history.setdefault(mr_name, {})
+    for num in range(1, group_count + 1):
+        groups.setdefault(num, [0, 0])[1] += len(violations_by_mutant)
+    for violations in violations_by_mutant.values():
+        for num in {group_number(v) for v in violations if is_group_violation(v)}:
+            groups[num][0] += 1
+
+
+def group_order(history, mr_name, group_count):
+    """Group numbers of an MR sorted by descending historical kill rate
+
+    Groups without history keep their original position relative to each other
+    and come after groups known to kill.
+    """
+    groups = history.get(mr_name, {})
+
+    def kill_rate(num):
+        kills, trials = groups.get(num, (0, 0))
+        return kills / trials if trials else 0.0
+
+    return sorted(range(1, group_count + 1), key=lambda num: (-kill_rate(num), num))
@@ -0,0 +1,194 @@
+"""
+Kill-matrix analytics for mutation testing
+Results are held as a boolean mutant x test-group NumPy matrix; scores,
+subsumption, redundant groups and the dominator set are computed on it with
+array operations instead of set bookkeeping over mutant IDs. Cells killed by
+the watchdog (timeout or memory budget) are not attributable to a test group;
+their outcome is kept in a separate int8 mutant x MR matrix.
+"""
+
+import numpy as np
+
+from kill_history import group_number, is_group_violation
+from parallel_runner import OUT_OF_MEMORY, TIMEOUT
+
+# Watchdog outcome codes of a (mutant, MR) cell; WATCHDOG marks cells loaded
+# from files that only recorded that the watchdog killed them
+RAN, TIMED_OUT, OVER_MEMORY, WATCHDOG = 0, 1, 2, 3
+OUTCOME_CODES = {TIMEOUT: TIMED_OUT, OUT_OF_MEMORY: OVER_MEMORY}
+
+
+class KillMatrix:
+    """Boolean matrix where kills[m, g] means test group g killed mutant m
+
+    Args:
+        mutant_ids (list): Row labels, e.g. 'mutant_01'
+        groups (list): Column labels as (mr_name, group_num), grouped by MR
+        kills (np.ndarray): Boolean array of shape (len(mutant_ids), len(groups))
+        outcomes (np.ndarray): int8 array of shape (len(mutant_ids), MR count)
+            holding the watchdog outcome code of each (mutant, MR) cell; all
+            RAN if omitted
+    """
+
+    def __init__(self, mutant_ids, groups, kills, outcomes=None):
+        self.mutant_ids = list(mutant_ids)
+        self.groups = list(groups)
+        self.kills = np.asarray(kills, dtype=bool)
+        self.mr_names = list(dict.fromkeys(mr_name for mr_name, _ in self.groups))
+        if outcomes is None:
+            outcomes = np.zeros((len(self.mutant_ids), len(self.mr_names)), dtype=np.int8)
+        self.outcomes = np.asarray(outcomes, dtype=np.int8)
+
+    @property
+    def watchdog(self):
+        """Boolean (mutants x MRs) matrix of cells killed by the watchdog"""
+        return self.outcomes != RAN
+
+    @classmethod
+    def from_results(cls, matrix, mutant_nums, mr_cases):
+        """Build the matrix from runner results
+
+        Args:
+            matrix (dict): (mutant_num, mr_name) -> (killed, violations, ...)
+            mutant_nums (list): Mutants in row order
+            mr_cases (dict): MR name -> list of test groups
+        """
+        groups = [(mr_name, num) for mr_name, cases in mr_cases.items()
+                  for num in range(1, len(cases) + 1)]
+        column = {group: j for j, group in enumerate(groups)}
+        kills = np.zeros((len(mutant_nums), len(groups)), dtype=bool)
+        outcomes = np.zeros((len(mutant_nums), len(mr_cases)), dtype=np.int8)
+        for row, mutant_num in enumerate(mutant_nums):
+            for k, mr_name in enumerate(mr_cases):
+                for violation in matrix[(mutant_num, mr_name)][1]:
+                    if is_group_violation(violation):
+                        kills[row, column[(mr_name, group_number(violation))]] = True
+                    else:
+                        outcomes[row, k] = OUTCOME_CODES.get(violation, WATCHDOG)
+        return cls([f"mutant_{num:02d}" for num in mutant_nums], groups, kills, outcomes)
+
+    def save(self, path):
+        """Write the matrix and its labels to a .npz file"""
+        np.savez_compressed(path, kills=self.kills, outcomes=self.outcomes,
+                            mutant_ids=np.array(self.mutant_ids),
+                            groups=np.array([f"{mr_name}:{num}" for mr_name, num in self.groups]))
+
+    @classmethod
+    def load(cls, path):
+        """Read a matrix written by save()
+
+        Older files hold a boolean 'watchdog' matrix instead of outcome
+        codes; its cells are loaded as WATCHDOG.
+        """
+        data = np.load(path)
+        groups = [(label.split(':')[0], int(label.split(':')[1])) for label in data['groups']]
+        outcomes = None
+        if 'outcomes' in data:
+            outcomes = data['outcomes']
+        elif 'watchdog' in data:
+            outcomes = np.where(data['watchdog'], WATCHDOG, RAN)
+        return cls(data['mutant_ids'].tolist(), groups, data['kills'], outcomes)
+
+    def mr_mask(self, mr_name):
+        """Boolean column mask of an MR's test groups"""
+        return np.array([name == mr_name for name, _ in self.groups], dtype=bool)
+
+    def killed_by_mr(self):
+        """Boolean (mutants x MRs) matrix: killed by a group of the MR or by the watchdog"""
+        return np.column_stack([self.kills[:, self.mr_mask(mr_name)].any(axis=1)
+                                for mr_name in self.mr_names]) | self.watchdog
+
+    def mr_scores(self):
+        """Mutation score of each MR as a fraction of all mutants"""
+        return dict(zip(self.mr_names, self.killed_by_mr().mean(axis=0)))
+
+    def killed(self):
+        """Boolean vector of mutants killed by at least one group or by the watchdog"""
+        return self.kills.any(axis=1) | self.watchdog.any(axis=1)
+
+    def killed_by_all_mrs(self):
+        """Boolean vector of mutants killed by every MR"""
+        return self.killed_by_mr().all(axis=1)
+
+    def killed_only_by(self, mr_name):
+        """Boolean vector of mutants killed by `mr_name` and no other MR"""
+        by_mr = self.killed_by_mr()
+        j = self.mr_names.index(mr_name)
+        return by_mr[:, j] & (by_mr.sum(axis=1) == 1)
+
+    def subsumption(self):
+        """Boolean (mutants x mutants) matrix where [a, b] means a subsumes b
+
+        A killed mutant a subsumes b when every test group that kills a also
+        kills b. Mutants with identical kill sets subsume each other.
+        """
+        k = self.kills.astype(np.int32)
+        counts = k.sum(axis=1)
+        overlap = k @ k.T
+        return (overlap == counts[:, None]) & (counts[:, None] > 0)
+
+    def dominator_set(self):
+        """Indices of the dominator mutants
+
+        Mutants killed by a test group that are not strictly subsumed by any other mutant,
+        keeping the first mutant of each group with identical kill sets.
+        """
+        subsumes = self.subsumption()
+        strict = subsumes & ~subsumes.T
+        dominated = strict.any(axis=0)
+        _, first = np.unique(self.kills, axis=0, return_index=True)
+        representative = np.zeros(len(self.mutant_ids), dtype=bool)
+        representative[first] = True
+        return np.flatnonzero(self.kills.any(axis=1) & ~dominated & representative)
+
+    def redundant_groups(self):
+        """Indices of test groups whose kills are covered by a single other group
+
+        A group is redundant if it kills nothing, or if another group kills a
+        strict superset of its mutants, or the same mutants and comes earlier.
+        """
+        g = self.kills.T.astype(np.int32)
+        counts = g.sum(axis=1)
+        overlap = g @ g.T
+        covered = overlap == counts[:, None]
+        np.fill_diagonal(covered, False)
+        strict_superset = covered & (counts[None, :] > counts[:, None])
+        earlier_equal = covered & (counts[None, :] == counts[:, None]) & np.tri(len(counts), k=-1, dtype=bool)
+        return np.flatnonzero((counts == 0) | strict_superset.any(axis=1) | earlier_equal.any(axis=1))
+
+    def group_label(self, j):
+        """Readable label of column j, e.g. 'MR2/MG5'"""
+        mr_name, num = self.groups[j]
+        return f"{mr_name}/MG{num}"
+
+    def print_report(self):
+        """Print subsumption, dominator and redundancy analytics"""
+        ids = np.array([m.split('_')[-1] for m in self.mutant_ids])
+        print("\nKILL MATRIX ANALYTICS")
+        print("-" * 80)
+        print(f"Matrix: {len(self.mutant_ids)} mutants x {len(self.groups)} test groups, "
+              f"{int(self.kills.sum())} kills")
+        for code, reason in ((TIMED_OUT, "timeout"), (OVER_MEMORY, "memory budget"),
+                             (WATCHDOG, "the watchdog, outcome not recorded")):
+            cells = self.outcomes == code
+            if cells.any():
+                mutants = np.flatnonzero(cells.any(axis=1))
+                print(f"Killed by {reason} ({len(mutants)} mutants, {int(cells.sum())} cells): "
+                      f"{', '.join(ids[mutants])}")
+
+        for mr_name, score in self.mr_scores().items():
+            print(f"  {mr_name} score: {score * 100:.2f}%")
+
+        dominators = self.dominator_set()
+        print(f"\nDominator mutants ({len(dominators)}): {', '.join(ids[dominators])}")
+
+        subsumes = self.subsumption()
+        strict = subsumes & ~subsumes.T
+        print("Strict subsumption (mutant -> mutants it subsumes):")
+        for a in np.flatnonzero(strict.any(axis=1)):
+            print(f"  {ids[a]} -> {', '.join(ids[np.flatnonzero(strict[a])])}")
+
+        redundant = self.redundant_groups()
+        print(f"\nRedundant test groups ({len(redundant)}/{len(self.groups)}):")
+        if len(redundant):
+            print(f"  {', '.join(self.group_label(j) for j in redundant)}")
@@ -0,0 +1,183 @@
+"""
+Memory accounting for mutation runs
+tracemalloc measures the peak and retained Python allocations of every
+(mutant, MR) cell and the allocation of each checker instance, and the
+process RSS is sampled alongside. Checker instances are tracked through weak
+references, so leaked checkers show up as live instances. A memory ceiling
+stops the run with a diagnosis as soon as a process exceeds it.
+"""
+
+import gc
+import os
+import tracemalloc
+import weakref
+
+MB = 1024 * 1024
+
+_checkers = weakref.WeakSet()
+
+
+class MemoryCeilingError(RuntimeError):
+    """Raised when a process exceeds the configured memory ceiling"""
+
+
+def process_rss(pid='self'):
+    """Resident set size of a process in bytes, or None where /proc is unavailable"""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def rss_bytes():
+    """Resident set size of this process, or 0 where /proc is unavailable"""
+    return process_rss() or 0
+
+
+def private_bytes():
+    """Memory private to this process (not shared with the parent), or None if unknown
+
+    With forked workers this is what each additional worker costs; the
+    dictionary inherited from the parent stays shared.
+    """
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            return sum(int(line.split()[1]) * 1024 for line in f if line.startswith('Private_'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def total_memory():
+    """Physical memory of the machine in bytes, or None if unknown"""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (ValueError, OSError):
+        return None
+
+
+def traced_memory():
+    """Bytes currently traced by tracemalloc, 0 when it is not tracing"""
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+
+def track_checker(checker):
+    """Register a checker instance so that leaks can be counted"""
+    try:
+        _checkers.add(checker)
+    except TypeError:
+        pass
+
+
+def live_checkers():
+    """Number of tracked checker instances still referenced"""
+    gc.collect()
+    return len(_checkers)
+
+
+def measure_memory(func, metrics, label, ceiling=None):
+    """Call func() and store its memory usage in metrics['memory']
+
+    Args:
+        func (callable): The cell to run
+        metrics (dict): Dict receiving the usage (bytes)
+        label (str): Cell name used in a diagnosis, e.g. 'mutant_05/MR2'
+        ceiling (float): RSS ceiling in MB; exceeding it raises MemoryCeilingError
+
+    Returns:
+        The result of func()
+    """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    usage = {
+        'peak': peak - before,
+        'retained': current - before,
+        'rss': rss_bytes(),
+        'private': private_bytes(),
+        'live_checkers': live_checkers(),
+        'pid': os.getpid(),
+    }
+    metrics['memory'] = usage
+    if ceiling and usage['rss'] > ceiling * MB:
+        raise MemoryCeilingError(diagnosis(label, usage, ceiling))
+    return result
+
+
+def check_baseline(ceiling):
+    """Raise MemoryCeilingError if the process exceeds the ceiling before any cell runs
+
+    Call after loading the shared data, so that a ceiling below what the
+    dictionary alone needs is not blamed on the first mutant.
+    """
+    rss = rss_bytes()
+    if ceiling and rss > ceiling * MB:
+        raise MemoryCeilingError(f"The shared dictionary and test data alone take {rss / MB:.1f} MB RSS "
+                                 f"before any mutant runs (ceiling {ceiling:g} MB)")
+
+
+def diagnosis(label, usage, ceiling, top=5):
+    """Explain a ceiling breach: the cell, the process and the largest allocation sites"""
+    lines = [
+        f"{label} pushed process {usage['pid']} to {usage['rss'] / MB:.1f} MB RSS "
+        f"(ceiling {ceiling:g} MB)",
+        f"  Cell peak: {usage['peak'] / MB:.2f} MB, retained after the cell: {usage['retained'] / MB:.2f} MB",
+        f"  Live checker instances: {usage['live_checkers']}",
+    ]
+    if usage['live_checkers'] > 1:
+        lines.append("  More than one live checker suggests leaked references; "
+                     "each unshared checker holds its own dictionary")
+    if tracemalloc.is_tracing():
+        lines.append("  Largest allocation sites:")
+        for stat in tracemalloc.take_snapshot().statistics('lineno')[:top]:
+            lines.append(f"    {stat.size / MB:8.2f} MB in {stat.count:7d} blocks  {stat.traceback[0]}")
+    return "\n".join(lines)
+
+
+def print_report(matrix, ceiling=None):
+    """Print per-mutant memory usage and how many workers fit in memory
+
+    Args:
+        matrix (dict): (mutant_num, mr_name) -> runner result whose metrics
+            dict (fourth element) holds 'memory' and 'checker_bytes'
+        ceiling (float): Configured RSS ceiling in MB, if any
+    """
+    per_mutant = {}
+    for (mutant_num, _), result in matrix.items():
+        if len(result) < 4 or 'memory' not in result[3]:
+            continue
+        per_mutant.setdefault(mutant_num, []).append(result[3])
+    if not per_mutant:
+        return
+
+    print("\nMEMORY REPORT")
+    print("-" * 80)
+    print(f"  {'Mutant':<11} {'Peak (KB)':>10} {'Retained (KB)':>14} {'Checker (KB)':>13} {'RSS (MB)':>9}")
+    processes = {}
+    for mutant_num in sorted(per_mutant):
+        cells = per_mutant[mutant_num]
+        peak = max(cell['memory']['peak'] for cell in cells)
+        retained = sum(cell['memory']['retained'] for cell in cells)
+        checker = max(cell.get('checker_bytes', 0) for cell in cells)
+        rss = max(cell['memory']['rss'] for cell in cells)
+        print(f"  mutant_{mutant_num:02d}   {peak / 1024:10.1f} {retained / 1024:14.1f} "
+              f"{checker / 1024:13.1f} {rss / MB:9.1f}")
+        for cell in cells:
+            processes[cell['memory']['pid']] = cell['memory']
+
+    last = list(processes.values())
+    print(f"\n  Processes: {len(last)}, max RSS {max(u['rss'] for u in last) / MB:.1f} MB"
+          + (f" (ceiling {ceiling:g} MB)" if ceiling else ""))
+    print(f"  Live checker instances at the end of a cell: max {max(u['live_checkers'] for u in last)}")
+    private = [u['private'] for u in last if u['private'] is not None]
+    if private:
+        per_worker = max(private)
+        shared = max(u['rss'] for u in last) - per_worker
+        print(f"  Private memory per process: {per_worker / MB:.1f} MB, shared: {max(shared, 0) / MB:.1f} MB")
+        node = total_memory()
+        if node and per_worker:
+            print(f"  Estimated workers fitting in {node / MB / 1024:.1f} GB: "
+                  f"{int((node - max(shared, 0)) // per_worker)}")
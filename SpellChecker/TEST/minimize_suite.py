@@ -0,0 +1,94 @@
+"""
+Test-suite minimization over the kill matrix
+Finds the smallest subset of MR test groups that still kills every mutant the
+full suite kills, and saves it as the "fast" suite selectable in the runner.
+"""
+
+import itertools
+import json
+import os
+
+import numpy as np
+
+FAST_SUITE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fast_suite.json')
+
+# Largest candidate count for which the exact search is attempted
+EXACT_LIMIT = 20
+
+
+def greedy_cover(kills, candidates):
+    """Greedy set cover: repeatedly take the group killing most uncovered mutants"""
+    uncovered = kills[:, candidates].any(axis=1)
+    chosen = []
+    while uncovered.any():
+        gains = (kills[:, candidates] & uncovered[:, None]).sum(axis=0)
+        best = candidates[int(np.argmax(gains))]
+        chosen.append(best)
+        uncovered &= ~kills[:, best]
+    return sorted(chosen)
+
+
+def exact_cover(kills, candidates, upper_bound):
+    """Smallest cover found by trying subsets in increasing size
+
+    Returns None if no cover smaller than `upper_bound` groups exists.
+    """
+    target = kills[:, candidates].any(axis=1)
+    for size in range(1, upper_bound):
+        for combo in itertools.combinations(candidates, size):
+            if np.array_equal(kills[:, list(combo)].any(axis=1), target):
+                return list(combo)
+    return None
+
+
+def minimize(kill_matrix):
+    """Column indices of a minimum-size suite with the same combined score
+
+    Groups dominated by another group are dropped first; the rest are covered
+    greedily, and exactly when few enough candidates remain.
+    """
+    redundant = set(kill_matrix.redundant_groups().tolist())
+    candidates = [j for j in range(len(kill_matrix.groups)) if j not in redundant]
+    if not candidates:
+        return []
+
+    chosen = greedy_cover(kill_matrix.kills, candidates)
+    if len(candidates) <= EXACT_LIMIT:
+        exact = exact_cover(kill_matrix.kills, candidates, len(chosen))
+        if exact is not None:
+            chosen = exact
+    return chosen
+
+
+def suite_from_columns(kill_matrix, columns):
+    """Convert column indices to {mr_name: [group numbers]} covering every MR"""
+    suite = {mr_name: [] for mr_name in kill_matrix.mr_names}
+    for j in sorted(columns):
+        mr_name, num = kill_matrix.groups[j]
+        suite[mr_name].append(num)
+    return suite
+
+
+def save_suite(suite, path=FAST_SUITE_FILE):
+    """Write a suite selection to JSON"""
+    with open(path, 'w') as f:
+        json.dump(suite, f, indent=2)
+        f.write("\n")
+
+
+def load_suite(path=FAST_SUITE_FILE):
+    """Read a suite selection written by save_suite()"""
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    from kill_matrix import KillMatrix
+
+    kill_matrix = KillMatrix.load('kill_matrix.npz')
+    columns = minimize(kill_matrix)
+    suite = suite_from_columns(kill_matrix, columns)
+    save_suite(suite)
+    print(f"Fast suite: {len(columns)}/{len(kill_matrix.groups)} groups "
+          f"({', '.join(kill_matrix.group_label(j) for j in columns)})")
+    print(f"Saved to '{FAST_SUITE_FILE}'")
@@ -0,0 +1,89 @@
+"""
+Seeded generator of metamorphic test groups sampled from the dictionary
+Groups have the same shape as the hand-written MR*_TEST_CASES: (SI, FI) pairs
+whose follow-up comes from the MR's registered transform, and plain inputs
+for property MRs such as MR4. Every group is derived from its own
+(seed, MR, index) random stream, so a suite of any size is reproducible,
+random-access and never materialized: groups are built when they are read.
+"""
+
+import random
+from collections.abc import Sequence
+
+from mr_registry import get_mr, recase
+from unknown_words import dictionary_index, unknown_word, word_pool
+
+# Shapes cycled through by the generated groups of every MR
+KINDS = ('basic', 'duplicates', 'mixed', 'long', 'case')
+
+# Word counts of source inputs, by kind
+SHORT_LENGTH = (1, 6)
+LONG_LENGTH = (50, 200)
+
+
+def source_input(rng, kind, pool, index):
+    """Source input of a group of the given kind"""
+    low, high = LONG_LENGTH if kind == 'long' else SHORT_LENGTH
+    words = rng.choices(pool, k=rng.randint(low, high))
+    if kind == 'duplicates':
+        words += rng.choices(words, k=rng.randint(1, len(words)))
+    elif kind == 'mixed':
+        words += [unknown_word(rng, pool, index) for _ in range(rng.randint(1, 3))]
+    elif kind == 'case':
+        words = recase(words, rng)
+    rng.shuffle(words)
+    return words
+
+
+def generate_group(mr_name, index, seed=0, language='en'):
+    """Group `index` of an MR's generated suite"""
+    rng = random.Random(f"{seed}:{mr_name}:{index}")
+    kind = KINDS[index % len(KINDS)]
+    pool = word_pool(language)
+    index = dictionary_index(language)
+    si = source_input(rng, kind, pool, index)
+
+    mr = get_mr(mr_name)
+    if mr.is_property:
+        # At least one known word, so the output must not be empty
+        if not any(w in index for w in si):
+            si.insert(rng.randint(0, len(si)), rng.choice(pool))
+        return si
+    return si, mr.follow_up(si, rng)
+
+
+class GeneratedGroups(Sequence):
+    """Lazily generated test groups of one MR, usable in place of MR*_TEST_CASES
+
+    Args:
+        mr_name (str): MR the groups are generated for
+        count (int): Number of groups
+        seed (int): Seed of the suite
+        language (str): Dictionary the words are sampled from
+    """
+
+    def __init__(self, mr_name, count, seed=0, language='en'):
+        self.mr_name = mr_name
+        self.count = count
+        self.seed = seed
+        self.language = language
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return generate_group(self.mr_name, index, self.seed, self.language)
+
+    def __repr__(self):
+        return f"GeneratedGroups({self.mr_name!r}, count={self.count}, seed={self.seed}, language={self.language!r})"
+
+
+def generated_suite(mr_names, count, seed=0, language='en'):
+    """{mr_name: GeneratedGroups} for every MR"""
+    return {mr_name: GeneratedGroups(mr_name, count, seed, language) for mr_name in mr_names}
@@ -0,0 +1,184 @@
+"""
+Declarative registry of the metamorphic relations of known()
+An MR is declared as a follow-up transform plus an output relation; MRs with
+no follow-up (MR4) are properties of a single output instead. Relations are
+equality after normalizing both outputs, so composing MRs composes their
+transforms and normalizations: PERMUTATION.then(CASE_CHANGE) permutes and
+then re-cases the source, and compares outputs ignoring case.
+"""
+
+import random
+
+from unknown_words import dictionary_index, unknown_word, word_pool
+
+
+def _same(output):
+    return output
+
+
+def _lowercased(output):
+    return {w.lower() for w in output}
+
+
+def permute(words, rng):
+    """A different ordering of `words` when one exists"""
+    follow = list(words)
+    for _ in range(3):
+        rng.shuffle(follow)
+        if follow != list(words):
+            break
+    return follow
+
+
+def recase(words, rng):
+    """Every word in a random one of lower, upper, title or swapped case"""
+    return [rng.choice((str.lower, str.upper, str.title, str.swapcase))(w) for w in words]
+
+
+def add_unknowns(words, rng):
+    """`words` with one to three guaranteed-unknown words inserted at random positions"""
+    pool, index = word_pool(), dictionary_index()
+    follow = list(words)
+    for _ in range(rng.randint(1, 3)):
+        # Near misses of real words are the unknowns most likely to expose a mutant
+        follow.insert(rng.randint(0, len(follow)), unknown_word(rng, pool, index))
+    return follow
+
+
+def _non_empty(output):
+    # Output should be non-empty AND should not contain invalid content
+    return not (len(output) == 0 or '' in output)
+
+
+class MetamorphicRelation:
+    """One MR: a follow-up transform and output relation, or an output property
+
+    Args:
+        name (str): Short name, e.g. 'MR1'
+        title (str): Readable name, e.g. 'Permutation Invariance'
+        transform (callable): transform(words, rng) -> follow-up input
+        normalize (callable): Maps an output to the value compared between
+            source and follow-up output
+        prop (callable): prop(output) -> bool for MRs without a follow-up
+        groups (list): Hand-written test groups, (SI, FI) pairs or plain
+            inputs for property MRs
+    """
+
+    def __init__(self, name, title, transform=None, normalize=_same, prop=None, groups=()):
+        self.name = name
+        self.title = title
+        self.transform = transform
+        self.normalize = normalize
+        self.prop = prop
+        self.groups = list(groups)
+
+    @property
+    def is_property(self):
+        return self.prop is not None
+
+    def follow_up(self, source, rng):
+        """Follow-up input of `source`"""
+        return self.transform(source, rng)
+
+    def follow_ups(self, sources, seed=0):
+        """Lazily pair every source input with its follow-up input"""
+        rng = random.Random(seed)
+        for source in sources:
+            yield source, self.follow_up(source, rng)
+
+    def holds_for(self, source_output, follow_output=None):
+        """True if the relation holds between the outputs (or the property for one output)"""
+        if self.is_property:
+            return bool(self.prop(source_output))
+        return self.normalize(source_output) == self.normalize(follow_output)
+
+    def holds(self, checker, case):
+        """Run a test group through checker.known() and check the relation
+
+        Exceptions raised by known() propagate to the caller.
+        """
+        if self.is_property:
+            return self.holds_for(checker.known(case))
+        source, follow = case
+        return self.holds_for(checker.known(source), checker.known(follow))
+
+    def then(self, other):
+        """MR applying this transform, then `other`'s, comparing under both normalizations"""
+        if self.is_property or other.is_property:
+            raise ValueError("Only MRs with a follow-up transform can be composed")
+        return MetamorphicRelation(
+            f"{self.name}+{other.name}", f"{self.title}, then {other.title}",
+            transform=lambda words, rng: other.transform(self.transform(words, rng), rng),
+            normalize=lambda output: other.normalize(self.normalize(output)))
+
+    def __repr__(self):
+        return f"MetamorphicRelation({self.name!r}, {self.title!r})"
+
+
+PERMUTATION = MetamorphicRelation('MR1', 'Permutation Invariance', transform=permute, groups=[
+    (['cat', 'dog', 'bird'], ['dog', 'bird', 'cat']),
+    (['hello', 'world'], ['world', 'hello']),
+    (['test', 'python', 'code'], ['code', 'test', 'python']),
+    (['apple', 'banana'], ['banana', 'apple']),
+    (['one', 'two', 'three', 'four'], ['three', 'one', 'four', 'two']),
+    (['a', 'I', 'to'], ['to', 'I', 'a']),
+    (['apple', 'apple', 'banana'], ['banana', 'apple', 'apple'])
+])
+
+UNKNOWN_ADDITION = MetamorphicRelation('MR2', 'Unknown Addition', transform=add_unknowns, groups=[
+    (['hello', 'world', 'test'], ['hello', 'world', 'test', 'asdfgh']),
+    (['cat', 'dog'], ['cat', 'dog', 'xyz123']),
+    (['python', 'java'], ['python', 'java', 'qqqq']),
+    (['apple'], ['apple', 'zzzzz']),
+    (['the', 'quick', 'brown'], ['the', 'quick', 'brown', 'xjkdf']),
+    (['I', 'a', 'to'], ['I', 'a', 'to', 'xyz']),
+    (['hello', 'world'], ['hello', 'world', 'xyzabc', 'qwerty', 'asdfzxcv'])
+])
+
+CASE_CHANGE = MetamorphicRelation('MR3', 'Case Invariance', transform=recase, normalize=_lowercased, groups=[
+    (['Hello', 'World'], ['hello', 'world']),
+    (['PYTHON', 'java'], ['python', 'JAVA']),
+    (['Test', 'CODE'], ['test', 'code']),
+    (['Apple', 'BANANA'], ['APPLE', 'banana']),
+    (['The', 'QUICK', 'brown'], ['THE', 'quick', 'BROWN']),
+    (['A', 'I'], ['a', 'i']),
+    (['THE', 'and'], ['the', 'AND'])
+])
+
+NON_EMPTY = MetamorphicRelation('MR4', 'Non-Empty Property', prop=_non_empty, groups=[
+    ['hello', 'xyzabc'],
+    ['xyzabc', 'world'],
+    ['qqqq', 'test', 'zzzzz'],
+    ['python'],
+    ['asdfgh', 'the', 'jklqw'],
+    ['a', 'xyzabc'],
+    ['I', 'qqqq'],
+])
+
+REGISTRY = {mr.name: mr for mr in (PERMUTATION, UNKNOWN_ADDITION, CASE_CHANGE, NON_EMPTY)}
+
+
+def register(mr):
+    """Add an MR to the registry and return it
+
+    Raises ValueError if another MR is registered under the same name.
+    """
+    if REGISTRY.get(mr.name, mr) is not mr:
+        raise ValueError(f"An MR named {mr.name!r} is already registered")
+    REGISTRY[mr.name] = mr
+    return mr
+
+
+def get_mr(name):
+    """Registered MR by name
+
+    A composition such as 'MR1+MR3' is built with then() from its
+    registered parts and registered on first use.
+    """
+    if name not in REGISTRY and '+' in name:
+        first, *rest = name.split('+')
+        mr = get_mr(first)
+        for part in rest:
+            mr = mr.then(get_mr(part))
+        return register(mr)
+    return REGISTRY[name]
@@ -0,0 +1,118 @@
+"""
+Duplicate and likely-equivalent mutant detection
+Before execution, each mutant's known() is normalized at the AST and bytecode
+level and hashed; mutants sharing a hash are duplicates and only one
+representative per class needs to run. Output fingerprints on a cheap probe
+set additionally flag mutants that behave like the original or like each other.
+"""
+
+import ast
+import hashlib
+
+# Inputs probed in addition to the MR test groups
+PROBE_INPUTS = [
+    [],
+    [''],
+    ['hello'],
+    ['HELLO', 'World'],
+    ['hello', 'hello', 'world'],
+    ['xyzzyq', 'qwxzv'],
+    ['a', 'I', 'the', 'of'],
+    ['antidisestablishmentarianism', 'supercalifragilisticexpialidocious'],
+]
+
+
+def known_function(source):
+    """AST of the known() method defined in a mutant module's source"""
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.FunctionDef) and node.name == 'known':
+            return node
+    raise ValueError("No known() method found in mutant source")
+
+
+def _strip_docstring(func):
+    body = func.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        func.body = body[1:] or [ast.Pass()]
+    return func
+
+
+def ast_hash(source):
+    """Hash of known()'s AST without docstring, comments or positions"""
+    func = _strip_docstring(known_function(source))
+    return hashlib.sha256(ast.dump(func, annotate_fields=False).encode('utf-8')).hexdigest()
+
+
+def _code_fingerprint(code):
+    parts = [code.co_code, repr(code.co_names), repr(code.co_varnames)]
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            parts.append(_code_fingerprint(const))
+        else:
+            parts.append(repr(const))
+    return b'\0'.join(p if isinstance(p, bytes) else p.encode('utf-8') for p in parts)
+
+
+def bytecode_hash(source):
+    """Hash of known()'s compiled bytecode, constants and names"""
+    func = _strip_docstring(known_function(source))
+    func.decorator_list = []
+    module = ast.fix_missing_locations(ast.Module(body=[func], type_ignores=[]))
+    code = compile(module, '<mutant>', 'exec')
+    known_code = next(c for c in code.co_consts if hasattr(c, 'co_code'))
+    return hashlib.sha256(_code_fingerprint(known_code)).hexdigest()
+
+
+def duplicate_classes(sources):
+    """Group mutants whose known() is identical after normalization
+
+    Args:
+        sources (dict): mutant number -> module source
+
+    Returns:
+        dict: mutant number -> representative mutant number (lowest in its class)
+    """
+    representative = {}
+    seen = {}
+    for num in sorted(sources):
+        keys = [('ast', ast_hash(sources[num])), ('bytecode', bytecode_hash(sources[num]))]
+        match = next((seen[key] for key in keys if key in seen), num)
+        representative[num] = match
+        for key in keys:
+            seen.setdefault(key, match)
+    return representative
+
+
+def output_fingerprint(checker, probes):
+    """Tuple describing known()'s output (or error type) on every probe"""
+    results = []
+    for words in probes:
+        try:
+            output = checker.known(list(words))
+            results.append((type(output).__name__, tuple(sorted(output))))
+        except Exception as e:
+            results.append(('error', type(e).__name__))
+    return tuple(results)
+
+
+def likely_equivalent(fingerprints, original):
+    """Flag mutants that no probe distinguishes
+
+    Args:
+        fingerprints (dict): mutant number -> output_fingerprint()
+        original: output_fingerprint() of the unmutated checker
+
+    Returns:
+        tuple: (mutants matching the original, {mutant: earlier mutant with the same outputs})
+    """
+    as_original = sorted(num for num, fp in fingerprints.items() if fp == original)
+    same_as = {}
+    first = {}
+    for num in sorted(fingerprints):
+        fp = fingerprints[num]
+        if fp in first:
+            same_as[num] = first[fp]
+        else:
+            first[fp] = num
+    return as_original, same_as
@@ -0,0 +1,73 @@
+"""
+Cached loader for the generated mutant modules
+Mutants are resolved by absolute path, so results no longer depend on the
+working directory, and each module is imported at most once per process.
+"""
+
+import importlib.util
+import os
+import time
+
+MUTANTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'MUTANTS'))
+
+
+class MutantLoader:
+    """Registry handing out cached MutantSpellChecker classes by mutant number"""
+
+    def __init__(self, mutants_dir=MUTANTS_DIR):
+        self.mutants_dir = mutants_dir
+        self.import_times = {}
+        self._classes = {}
+        self._errors = {}
+
+    def path_for(self, mutant_num):
+        """Absolute path of the file for mutant `mutant_num`"""
+        return os.path.join(self.mutants_dir, f"mutant_{mutant_num:02d}.py")
+
+    def get_checker_class(self, mutant_num):
+        """Return the MutantSpellChecker class of a mutant, importing it on first use
+
+        A mutant that fails to import raises the same error on every request
+        without being imported again.
+        """
+        if mutant_num in self._errors:
+            raise self._errors[mutant_num]
+        if mutant_num not in self._classes:
+            start = time.perf_counter()
+            try:
+                spec = importlib.util.spec_from_file_location(f"mutant_{mutant_num:02d}", self.path_for(mutant_num))
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._classes[mutant_num] = module.MutantSpellChecker
+            except Exception as e:
+                self._errors[mutant_num] = e
+                raise
+            finally:
+                self.import_times[mutant_num] = time.perf_counter() - start
+        return self._classes[mutant_num]
+
+    def load_all(self, mutant_nums):
+        """Import every mutant in `mutant_nums` up front, ignoring failures"""
+        for num in mutant_nums:
+            try:
+                self.get_checker_class(num)
+            except Exception:
+                pass
+
+    def print_import_times(self):
+        """Print the import time of every mutant loaded so far"""
+        print("\nMUTANT IMPORT TIMES")
+        print("-" * 80)
+        for num in sorted(self.import_times):
+            status = " (FAILED)" if num in self._errors else ""
+            print(f"  mutant_{num:02d}: {self.import_times[num] * 1000:8.2f} ms{status}")
+        total = sum(self.import_times.values())
+        print(f"  Total:     {total * 1000:8.2f} ms for {len(self.import_times)} mutants")
+
+
+default_loader = MutantLoader()
+
+
+def get_mutant_class(mutant_num):
+    """Return the cached checker class of a mutant from the default registry"""
+    return default_loader.get_checker_class(mutant_num)
@@ -0,0 +1,75 @@
+"""
+Memoization of known() outputs for one mutant across all MRs
+Source inputs are shared between MRs (e.g. ['hello', 'world'] in MR1 and MR2),
+so each distinct input is evaluated once per mutant and reused afterwards.
+"""
+
+
+class OutputCache:
+    """known() outputs of one mutant keyed on the input tuple"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._outputs = {}
+
+    def known(self, checker, words):
+        """Return checker.known(words), evaluating each distinct input only once
+
+        Exceptions are cached too and re-raised on every later lookup.
+        """
+        key = tuple(words)
+        if key in self._outputs:
+            self.hits += 1
+        else:
+            self.misses += 1
+            try:
+                self._outputs[key] = (True, checker.known(list(key)))
+            except Exception as e:
+                self._outputs[key] = (False, e)
+        ok, value = self._outputs[key]
+        if not ok:
+            raise value
+        return value
+
+    def stats(self):
+        """Return the (hits, misses) counters"""
+        return self.hits, self.misses
+
+
+class CachedChecker:
+    """Checker proxy whose known() goes through an OutputCache"""
+
+    def __init__(self, checker, cache):
+        self.checker = checker
+        self.cache = cache
+
+    def known(self, words):
+        return self.cache.known(self.checker, words)
+
+
+_current = (None, None)
+
+
+def cache_for(mutant_key):
+    """Return the output cache of a mutant, starting a new one when the mutant changes
+
+    Jobs run mutant by mutant, so only the current mutant's cache is kept.
+    """
+    global _current
+    if _current[0] != mutant_key:
+        _current = (mutant_key, OutputCache())
+    return _current[1]
+
+
+def reset():
+    """Drop the current mutant's cache, e.g. when the set of mutants changes"""
+    global _current
+    _current = (None, None)
+
+
+def format_stats(hits, misses):
+    """One-line summary of cache counters"""
+    total = hits + misses
+    rate = (hits / total * 100) if total else 0.0
+    return f"{hits} hits, {misses} misses ({rate:.1f}% hit rate, {total} known() lookups)"
@@ -0,0 +1,215 @@
+"""
+Process-pool execution of the mutant x MR matrix
+The dictionary is warmed in the parent, then forked workers inherit it
+copy-on-write and receive (mutant, MR) jobs. Results are returned in job
+order so reports are identical to a serial run.
+
+With a wall-clock or memory budget, jobs run under a watchdog in reusable
+worker processes instead; a worker that exceeds the budget is killed and a
+fresh one is forked from the parent, which still holds the loaded dictionary.
+"""
+
+import gc
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from memory_report import process_rss
+from shared_dictionary import get_shared_word_frequency
+
+
+# Outcomes recorded for a job whose worker was killed by the watchdog
+TIMEOUT = 'TIMEOUT'
+OUT_OF_MEMORY = 'OUT OF MEMORY'
+
+# Seconds between memory checks of busy workers
+MEMORY_POLL_INTERVAL = 0.02
+
+
+def default_workers():
+    """Number of workers to use when none is requested"""
+    return os.cpu_count() or 1
+
+
+def can_fork():
+    """True if this platform supports the fork start method"""
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def run_matrix(func, mutant_nums, mr_names, workers=1, **watchdog):
+    """Evaluate func(mutant_num, mr_name) for every cell of the matrix
+
+    Returns a dict keyed by (mutant_num, mr_name). With workers <= 1, or where
+    fork is unavailable, the cells are evaluated serially in-process.
+    Watchdog options (timeout, memory_limit, on_kill) go to run_jobs().
+    """
+    jobs = [(num, mr_name) for num in mutant_nums for mr_name in mr_names]
+    return run_jobs(func, jobs, workers, **watchdog)
+
+
+def run_jobs(func, jobs, workers=1, timeout=None, memory_limit=None, on_kill=None):
+    """Evaluate func(mutant_num, mr_name) for each (mutant_num, mr_name) job
+
+    Jobs should be grouped by mutant. Returns a dict keyed by job.
+
+    Args:
+        timeout (float): Wall-clock budget per job in seconds
+        memory_limit (float): Budget in MB for a worker's memory growth
+            (resident set size above its size when forked)
+        on_kill (callable): on_kill(job, outcome) gives the result of a job
+            whose worker was killed, with outcome TIMEOUT or OUT_OF_MEMORY
+    """
+    if (timeout or memory_limit) and jobs and can_fork():
+        return _run_watched(func, jobs, max(1, workers), timeout, memory_limit, on_kill)
+    if workers <= 1 or len(jobs) <= 1 or not can_fork():
+        return {job: func(*job) for job in jobs}
+
+    # Load the dictionary before forking so every worker shares its pages
+    get_shared_word_frequency()
+    # Keep the collector from touching (and so copying) inherited objects
+    gc.freeze()
+
+    workers = min(workers, len(jobs))
+    # Whole mutants per chunk, so a worker sees all MRs of a mutant together
+    mutant_count = len({num for num, _ in jobs})
+    cells_per_mutant = max(1, len(jobs) // mutant_count)
+    chunksize = cells_per_mutant * max(1, mutant_count // (workers * 4))
+    ctx = multiprocessing.get_context('fork')
+    try:
+        with ctx.Pool(workers) as pool:
+            results = pool.starmap(func, jobs, chunksize=chunksize)
+    finally:
+        gc.unfreeze()
+
+    return dict(zip(jobs, results))
+
+
+def _worker_loop(func, conn):
+    """Run chunks of jobs sent by the parent, reporting each result as it completes"""
+    while True:
+        try:
+            chunk = conn.recv()
+        except EOFError:
+            return
+        if chunk is None:
+            return
+        for job in chunk:
+            try:
+                conn.send((job, True, func(*job)))
+            except Exception as e:
+                conn.send((job, False, e))
+
+
+class _Worker:
+    """A forked worker process and the chunk of jobs it is running"""
+
+    def __init__(self, ctx, func):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_loop, args=(func, child), daemon=True)
+        self.process.start()
+        child.close()
+        self.base_rss = process_rss(self.process.pid)
+        self.pending = []
+        self.deadline = None
+
+    def assign(self, chunk, timeout):
+        self.pending = list(chunk)
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.conn.send(chunk)
+
+    def memory_growth(self):
+        rss = process_rss(self.process.pid)
+        if rss is None or self.base_rss is None:
+            return 0
+        return rss - self.base_rss
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join()
+        self.conn.close()
+
+
+def _run_watched(func, jobs, workers, timeout, memory_limit, on_kill):
+    """run_jobs() with each job under a wall-clock and memory watchdog
+
+    Workers receive whole mutants at a time and report every job as it
+    finishes; the deadline restarts with each job. A job that overruns is
+    recorded through on_kill() and the rest of its chunk moves to a new worker.
+    """
+    get_shared_word_frequency()
+    gc.freeze()
+
+    chunks = {}
+    for job in jobs:
+        chunks.setdefault(job[0], []).append(job)
+    queue = list(chunks.values())
+    queue.reverse()
+    limit = memory_limit * 1024 * 1024 if memory_limit else None
+
+    ctx = multiprocessing.get_context('fork')
+    results = {}
+    pool = []
+    try:
+        pool = [_Worker(ctx, func) for _ in range(min(workers, len(queue)))]
+        for worker in pool:
+            worker.assign(queue.pop(), timeout)
+
+        while any(worker.pending for worker in pool):
+            busy = [worker for worker in pool if worker.pending]
+            now = time.monotonic()
+            wake = [worker.deadline - now for worker in busy if worker.deadline]
+            if limit:
+                wake.append(MEMORY_POLL_INTERVAL)
+            ready = wait([worker.conn for worker in busy], max(0, min(wake)) if wake else None)
+
+            for i, worker in enumerate(pool):
+                if not worker.pending:
+                    continue
+                outcome = None
+                if worker.conn in ready:
+                    try:
+                        job, ok, value = worker.conn.recv()
+                    except EOFError:
+                        # The worker died without reporting, e.g. killed by the OS
+                        job, ok, value = worker.pending[0], None, None
+                        outcome = OUT_OF_MEMORY
+                    if outcome is None:
+                        if not ok:
+                            raise value
+                        results[job] = value
+                        worker.pending.pop(0)
+                        worker.deadline = time.monotonic() + timeout if timeout else None
+                elif worker.deadline and time.monotonic() >= worker.deadline:
+                    outcome = TIMEOUT
+                elif limit and worker.memory_growth() > limit:
+                    outcome = OUT_OF_MEMORY
+
+                if outcome is not None:
+                    job = worker.pending.pop(0)
+                    results[job] = on_kill(job, outcome) if on_kill else outcome
+                    if worker.pending:
+                        queue.append(worker.pending)
+                    worker.kill()
+                    if queue:
+                        worker = pool[i] = _Worker(ctx, func)
+
+                if not worker.pending and queue:
+                    worker.assign(queue.pop(), timeout)
+    finally:
+        for worker in pool:
+            if worker.process.is_alive() and not worker.pending:
+                worker.stop()
+            elif worker.process.is_alive():
+                worker.kill()
+        gc.unfreeze()
+
+    return {job: results[job] for job in jobs}
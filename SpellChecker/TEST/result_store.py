@@ -0,0 +1,59 @@
+"""
+Persistent store of (mutant, MR) results for incremental mutation testing
+Each cell is keyed on a hash of the mutant source, the MR definition and the
+pyspellchecker version, so only cells whose inputs changed are re-run.
+"""
+
+import hashlib
+import json
+import os
+
+import spellchecker
+
+STORE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mutation_result_store.json')
+
+
+def cell_key(mutant_source, mr_definition):
+    """Content hash identifying one (mutant, MR) cell"""
+    digest = hashlib.sha256()
+    for part in (mutant_source, mr_definition, spellchecker.__version__):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ResultStore:
+    """JSON file mapping cell keys to (killed, violations)"""
+
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        self._results = {}
+        self._used = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self._results = json.load(f)
+
+    def get(self, key):
+        """Return the stored (killed, violations) of a cell, or None if stale"""
+        if key not in self._results:
+            return None
+        self._used.add(key)
+        entry = self._results[key]
+        return entry['killed'], entry['violations']
+
+    def put(self, key, killed, violations):
+        """Record the result of a cell"""
+        self._results[key] = {'killed': killed, 'violations': violations}
+        self._used.add(key)
+
+    def save(self, prune=False):
+        """Write the store, keeping the cells of earlier runs
+
+        With prune, only the cells used in this run are kept, dropping
+        entries no longer referenced; a run over a subset of the cells
+        then forgets every other one.
+        """
+        keys = self._used if prune else self._results
+        results = {key: self._results[key] for key in sorted(keys)}
+        with open(self.path, 'w') as f:
+            json.dump(results, f, indent=1)
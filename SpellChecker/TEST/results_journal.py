@@ -0,0 +1,98 @@
+"""
+Append-only JSONL journal of mutation testing results
+Every test group result and every finished (mutant, MR) cell is appended as
+one JSON line the moment it completes, from whichever process computed it.
+An interrupted run can be resumed from the journal, and the report can be
+rebuilt from the journal alone.
+"""
+
+import json
+import os
+
+JOURNAL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mutation_journal.jsonl')
+
+
+class Journal:
+    """Writer and reader of one journal file
+
+    Records are written with a single O_APPEND write each, so lines from
+    forked workers never interleave. The file descriptor is opened lazily
+    per process, which keeps the journal picklable for worker jobs.
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self._fd = None
+        self._pid = None
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def _write_raw(self, data):
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        os.write(self._fd, data)
+
+    def _write(self, record):
+        self._write_raw((json.dumps(record) + "\n").encode('utf-8'))
+
+    def start(self, config):
+        """Truncate the journal and write the header of a new run"""
+        with open(self.path, 'w'):
+            pass
+        self._write({'type': 'run', 'config': config})
+
+    def resume(self, config):
+        """Reopen the journal of an interrupted run with the same config
+
+        Returns its finished cells as read() does, or None if the journal is
+        missing or was written with another config. A line cut off by a crash
+        is terminated so that new records start on a line of their own.
+        """
+        journalled, cells = self.read()
+        if journalled != config:
+            return None
+        with open(self.path, 'rb') as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._write_raw(b"\n")
+        return cells
+
+    def group(self, mutant_num, mr_name, group_num, violation):
+        """Record one test group result; `violation` is its label or None if it held"""
+        self._write({'type': 'group', 'mutant': mutant_num, 'mr': mr_name,
+                     'group': group_num, 'violation': violation})
+
+    def cell(self, mutant_num, mr_name, killed, violations, duplicate_of=None):
+        """Record a finished (mutant, MR) cell"""
+        record = {'type': 'cell', 'mutant': mutant_num, 'mr': mr_name,
+                  'killed': killed, 'violations': violations}
+        if duplicate_of is not None:
+            record['duplicate_of'] = duplicate_of
+        self._write(record)
+
+    def read(self):
+        """Return (config, {(mutant, mr_name): cell record}) of the journalled run
+
+        A truncated last line, as left by a crash mid-write, is ignored.
+        """
+        config = None
+        cells = {}
+        if not os.path.exists(self.path):
+            return config, cells
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record['type'] == 'run':
+                    config = record['config']
+                elif record['type'] == 'cell':
+                    cells[(record['mutant'], record['mr'])] = record
+        return config, cells
@@ -0,0 +1,164 @@
+"""
+Statistical estimation of mutation scores from a sample of mutants
+Mutants are drawn at random, or stratified by mutation operator as listed in
+mutants.csv, and the kill rate of the sample is turned into a score estimate
+with a confidence interval. Sampling can continue in rounds until the interval
+is narrow enough, trading exactness for a much shorter run.
+"""
+
+import csv
+import os
+import random
+import re
+from statistics import NormalDist
+
+MUTANTS_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'MUTANTS', 'mutants.csv')
+
+
+def operator_of(label):
+    """Operator family of a mutants.csv label
+
+    'Logical Operator Replacement (LOR): AND → OR' -> 'Logical Operator Replacement'
+    """
+    family = label.split(':')[0]
+    return re.sub(r'\s*\(.*?\)', '', family).strip()
+
+
+def load_strata(path=MUTANTS_CSV):
+    """Group mutant numbers by operator family
+
+    Returns:
+        dict: operator family -> sorted list of mutant numbers
+    """
+    strata = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            num = int(row['Mutant ID'].split('_')[-1])
+            strata.setdefault(operator_of(row['Mutation Operator']), []).append(num)
+    return {operator: sorted(nums) for operator, nums in strata.items()}
+
+
+def z_value(confidence):
+    """Two-sided standard normal quantile for a confidence level, e.g. 0.95 -> 1.96"""
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def merge_strata(strata, max_strata=None):
+    """Merge the smallest strata until few enough remain to be sampled twice
+
+    Strata are merged smallest first until there are at most `max_strata`
+    (default: the square root of the population) and none holds a single
+    mutant, so every stratum can contribute its own variance estimate.
+
+    Returns:
+        dict: stratum name -> sorted mutant numbers; merged names are
+        joined with ' + '
+    """
+    population = sum(len(nums) for nums in strata.values())
+    if max_strata is None:
+        max_strata = max(1, int(population ** 0.5))
+    merged = {operator: sorted(nums) for operator, nums in strata.items() if nums}
+    while len(merged) > 1 and (len(merged) > max_strata or min(len(nums) for nums in merged.values()) < 2):
+        first, second = sorted(merged, key=lambda operator: (len(merged[operator]), operator))[:2]
+        merged[f"{first} + {second}"] = sorted(merged.pop(first) + merged.pop(second))
+    return merged
+
+
+def estimate_score(strata, kills, confidence=0.95):
+    """Stratified estimate of the fraction of killed mutants
+
+    Each stratum's kill rate is weighted by its share of all mutants, and its
+    variance is the sample variance of its outcomes (n - 1 denominator) with
+    a finite population correction, so fully sampled strata contribute none.
+    The interval is an Agresti-Coull interval for the effective sample size
+    of that variance, capped at the real sample size, so all-killed or
+    all-survived samples still get a non-empty interval. A stratum with a single sampled mutant has no spread
+    of its own and uses the sample variance of the whole sample instead.
+
+    Args:
+        strata (dict): operator family -> mutant numbers (the whole population)
+        kills (dict): sampled mutant number -> killed (bool)
+        confidence (float): Confidence level of the interval
+
+    Returns:
+        tuple: (estimate, lower, upper) as fractions
+    """
+    z = z_value(confidence)
+    population = sum(len(nums) for nums in strata.values())
+    sampled, killed = len(kills), sum(kills.values())
+    pooled = killed * (sampled - killed) / (sampled * (sampled - 1)) if sampled > 1 else 0.25
+    estimate = 0.0
+    variance = 0.0
+    for nums in strata.values():
+        outcomes = [kills[num] for num in nums if num in kills]
+        if not outcomes:
+            raise ValueError("Every stratum needs at least one sampled mutant")
+        size, n, k = len(nums), len(outcomes), sum(outcomes)
+        weight = size / population
+        estimate += weight * k / n
+        spread = k * (n - k) / (n * (n - 1)) if n > 1 else pooled
+        variance += weight * weight * spread / n * (1 - n / size)
+    if sampled == population:
+        return estimate, estimate, estimate
+
+    # Sample size a simple random sample would need for the same variance,
+    # at most the actual one: strata sampled only twice often look
+    # homogeneous and understate their variance
+    effective = sampled / (1 - sampled / population)
+    if variance > 0 and 0 < estimate < 1:
+        effective = min(effective, estimate * (1 - estimate) / variance)
+    center = (effective * estimate + z * z / 2) / (effective + z * z)
+    margin = z * (center * (1 - center) / (effective + z * z)) ** 0.5
+    return estimate, max(0.0, min(estimate, center - margin)), min(1.0, max(estimate, center + margin))
+
+
+class MutantSampler:
+    """Draws mutants without replacement, optionally stratified by operator
+
+    Small operator families are first merged (see merge_strata). Stratified
+    draws keep every stratum's share of the sample proportional to its share
+    of the population, after first taking two mutants per stratum so each
+    has a variance estimate. Unstratified draws treat all mutants as one
+    stratum.
+
+    Args:
+        strata (dict): operator family -> mutant numbers
+        stratified (bool): Stratify by operator family
+        seed (int): Random seed
+        max_strata (int): Cap on the number of strata (default: square root
+            of the population)
+    """
+
+    def __init__(self, strata, stratified=True, seed=0, max_strata=None):
+        if stratified:
+            strata = merge_strata(strata, max_strata)
+        else:
+            strata = {'all': sorted(num for nums in strata.values() for num in nums)}
+        self.strata = strata
+        self.population = sum(len(nums) for nums in strata.values())
+        self._rng = random.Random(seed)
+        self._remaining = {operator: self._rng.sample(nums, len(nums))
+                           for operator, nums in strata.items()}
+        self.sampled = []
+
+    def exhausted(self):
+        return len(self.sampled) == self.population
+
+    def draw(self, count):
+        """Sample up to `count` more mutants and return their numbers"""
+        batch = []
+        if not self.sampled:
+            for operator in self.strata:
+                batch.extend(self._remaining[operator].pop() for _ in range(min(2, len(self.strata[operator]))))
+        target = min(self.population, len(self.sampled) + max(count, len(batch)))
+        while len(self.sampled) + len(batch) < target:
+            taken = len(self.sampled) + len(batch)
+            # Stratum furthest below its proportional allocation
+            operator = max((op for op in self.strata if self._remaining[op]),
+                           key=lambda op: (len(self.strata[op]) * (taken + 1) / self.population
+                                           - (len(self.strata[op]) - len(self._remaining[op])),
+                                           self._rng.random()))
+            batch.append(self._remaining[operator].pop())
+        self.sampled.extend(batch)
+        return batch
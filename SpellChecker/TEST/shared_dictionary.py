@@ -0,0 +1,115 @@
+"""
+Shared word-frequency store for mutation testing
+The English dictionary is decompressed and parsed once per run; every mutant
+checker attaches to the same read-only copy instead of loading its own.
+"""
+
+from collections.abc import Mapping
+
+from spellchecker import SpellChecker
+from spellchecker.spellchecker import WordFrequency
+
+_STORES = {}
+
+
+class ReadOnlyWordFrequency(WordFrequency):
+    """WordFrequency whose methods that would change the dictionary raise TypeError"""
+
+    read_only_message = "The word-frequency store is read-only"
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(self.read_only_message)
+
+    pop = _read_only
+    load_dictionary = _read_only
+    load_json = _read_only
+    load_text_file = _read_only
+    load_text = _read_only
+    load_words = _read_only
+    add = _read_only
+    remove_words = _read_only
+    remove = _read_only
+    remove_by_threshold = _read_only
+    _update_dictionary = _read_only
+
+
+class FrequencyView(Mapping):
+    """Read-only view of a word Counter; missing words count 0 as in the Counter"""
+
+    def __init__(self, counts):
+        self._counts = counts
+
+    def __getitem__(self, word):
+        return self._counts[word]
+
+    def __contains__(self, word):
+        return word in self._counts
+
+    def get(self, word, default=None):
+        return self._counts.get(word, default)
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+
+class SharedWordFrequency(ReadOnlyWordFrequency):
+    """Read-only WordFrequency built once and shared by all mutant checkers"""
+
+    read_only_message = "The shared word-frequency store is read-only"
+
+    def __init__(self, language='en'):
+        source = SpellChecker(language=language).word_frequency
+        super().__init__(case_sensitive=False)
+        self._dictionary = FrequencyView(source.dictionary)
+        self._total_words = source.total_words
+        self._unique_words = source.unique_words
+        self._letters = frozenset(source.letters)
+        self._longest_word_length = source.longest_word_length
+        self.language = language
+        self._view = self._dictionary
+        self.fingerprint = self._compute_fingerprint()
+        self.checksum = self._compute_checksum()
+
+    def _compute_fingerprint(self):
+        """Constant-time summary of the store used to detect modification
+
+        The words themselves sit behind a read-only view, so replacing the
+        view or changing a scalar attribute is all a mutant could do.
+        """
+        return (len(self._dictionary), self._total_words, self._unique_words,
+                self._longest_word_length, len(self._letters))
+
+    def _compute_checksum(self):
+        return sum(self._dictionary.values())
+
+    def assert_unchanged(self, mutant_id=None, full=False):
+        """Raise AssertionError if the shared dictionary has been modified
+
+        With full, the word frequencies are also summed and compared; this
+        walks the whole dictionary, so it is meant for the end of a run.
+        """
+        if (self._dictionary is not self._view or self._compute_fingerprint() != self.fingerprint
+                or (full and self._compute_checksum() != self.checksum)):
+            who = mutant_id or "a mutant"
+            raise AssertionError(f"{who} modified the shared '{self.language}' word-frequency store")
+
+
+def get_shared_word_frequency(language='en'):
+    """Return the shared store for `language`, loading it on first use"""
+    if language not in _STORES:
+        _STORES[language] = SharedWordFrequency(language)
+    return _STORES[language]
+
+
+def build_checker(checker_class, language='en'):
+    """Create a checker of `checker_class` attached to the shared store
+
+    The checker is constructed without a language so no dictionary is loaded,
+    then pointed at the shared word frequency.
+    """
+    checker = checker_class(language=None)
+    checker._word_frequency = get_shared_word_frequency(language)
+    return checker
@@ -0,0 +1,99 @@
+"""
+Unit tests for the multi-language CheckerPool
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'SUT'))
+from checker_pool import CheckerPool
+
+
+class CountingChecker:
+    """Checker stub recording every load instead of reading a dictionary"""
+
+    loads = []
+    footprint = 100
+
+    def __init__(self, dictionary=None, language='en', case_sensitive=False):
+        self.key = (language, case_sensitive)
+
+    def warm(self):
+        # Widen the window in which concurrent first uses could race
+        time.sleep(0.05)
+        CountingChecker.loads.append(self.key)
+        return self
+
+    def memory_footprint(self):
+        return self.footprint
+
+    def known(self, words):
+        return {w for w in words if w.startswith(self.key[0])}
+
+
+def make_pool(**options):
+    CountingChecker.loads = []
+    return CheckerPool(factory=CountingChecker, **options)
+
+
+def test_concurrent_first_use_loads_once():
+    pool = make_pool()
+    barrier = threading.Barrier(16)
+    checkers = []
+
+    def use(language):
+        barrier.wait()
+        checkers.append(pool.get(language))
+
+    threads = [threading.Thread(target=use, args=(('en', 'es')[i % 2],)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(CountingChecker.loads) == [('en', False), ('es', False)]
+    assert len({id(checker) for checker in checkers}) == 2
+    assert pool.stats()['loads'] == 2
+
+
+def test_case_sensitivity_is_part_of_the_key():
+    pool = make_pool()
+    assert pool.get('en') is not pool.get('en', case_sensitive=True)
+    assert pool.get('en') is pool.get('en')
+    assert CountingChecker.loads == [('en', False), ('en', True)]
+
+
+def test_evicts_least_recently_used():
+    pool = make_pool(max_resident=2)
+    pool.get('en')
+    pool.get('es')
+    pool.get('en')
+    pool.get('fr')
+    assert pool.resident() == [('en', False), ('fr', False)]
+    assert pool.stats()['evictions'] == 1
+
+    # An evicted language is loaded again on its next use
+    pool.get('es')
+    assert CountingChecker.loads.count(('es', False)) == 2
+
+
+def test_evicts_to_fit_max_bytes():
+    pool = make_pool(max_resident=10, max_bytes=250)
+    for language in ('en', 'es', 'de'):
+        pool.get(language)
+    assert pool.resident() == [('es', False), ('de', False)]
+    assert pool.stats()['footprint'] == 200
+
+
+def test_keeps_a_single_checker_over_max_bytes():
+    pool = make_pool(max_bytes=50)
+    pool.get('en')
+    pool.get('ru')
+    assert pool.resident() == [('ru', False)]
+
+
+def test_known_uses_the_language_checker():
+    pool = make_pool()
+    assert pool.known(['es_uno', 'en_one'], 'es') == {'es_uno'}
@@ -0,0 +1,47 @@
+"""
+Unit tests comparing the memory-mapped compiled dictionary with the JSON one
+"""
+
+import os
+import sys
+
+import pytest
+from spellchecker import SpellChecker
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'SUT'))
+from compiled_dictionary import compile_dictionary, load_checker
+
+WORDS = ['hello', 'World', 'the', 'speling', 'xyzq', 'asdfgh', 'nan', '1.5', '']
+
+
+@pytest.fixture(scope='module')
+def checkers(tmp_path_factory):
+    path = tmp_path_factory.mktemp('dictionary') / 'en.spdict'
+    compile_dictionary(str(path))
+    return SpellChecker(language='en'), load_checker(str(path))
+
+
+def test_sizes_match(checkers):
+    parsed, mapped = checkers
+    assert mapped.word_frequency.unique_words == parsed.word_frequency.unique_words
+    assert mapped.word_frequency.total_words == parsed.word_frequency.total_words
+    assert mapped.word_frequency.longest_word_length == parsed.word_frequency.longest_word_length
+
+
+@pytest.mark.parametrize('word', WORDS)
+def test_lookups_match(checkers, word):
+    parsed, mapped = checkers
+    assert mapped[word] == parsed[word]
+    assert mapped.word_frequency[word] == parsed.word_frequency[word]
+    assert mapped.word_usage_frequency(word) == parsed.word_usage_frequency(word)
+    assert mapped.word_frequency.dictionary.get(word) == parsed.word_frequency.dictionary.get(word)
+    assert (word in mapped) == (word in parsed)
+
+
+def test_checker_methods_match(checkers):
+    parsed, mapped = checkers
+    assert mapped.known(WORDS) == parsed.known(WORDS)
+    assert mapped.unknown(WORDS) == parsed.unknown(WORDS)
+    for word in ('speling', 'xyzq', 'helo'):
+        assert mapped.correction(word) == parsed.correction(word)
+        assert mapped.candidates(word) == parsed.candidates(word)
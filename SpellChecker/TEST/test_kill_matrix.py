@@ -0,0 +1,97 @@
+"""
+Unit tests for the kill-matrix analytics on a hand-built matrix
+"""
+
+import numpy as np
+
+from kill_matrix import OVER_MEMORY, RAN, TIMED_OUT, WATCHDOG, KillMatrix
+
+GROUPS = [('MR1', 1), ('MR1', 2), ('MR2', 1), ('MR2', 2)]
+
+# Rows: mutant_01 .. mutant_05, columns: GROUPS
+KILLS = [
+    [1, 1, 0, 0],  # 01: MR1 only, by both groups
+    [1, 0, 0, 0],  # 02: MR1/MG1 only
+    [0, 0, 1, 0],  # 03: MR2 only
+    [1, 0, 1, 0],  # 04: both MRs
+    [0, 0, 0, 0],  # 05: survives
+]
+
+
+def make_matrix():
+    return KillMatrix([f"mutant_{i:02d}" for i in range(1, 6)], GROUPS, np.array(KILLS, dtype=bool))
+
+
+def test_killed_by_mr():
+    by_mr = make_matrix().killed_by_mr()
+    assert by_mr.tolist() == [[True, False], [True, False], [False, True], [True, True], [False, False]]
+
+
+def test_scores_and_killed():
+    matrix = make_matrix()
+    assert matrix.mr_scores() == {'MR1': 0.6, 'MR2': 0.4}
+    assert matrix.killed().tolist() == [True, True, True, True, False]
+    assert matrix.killed_by_all_mrs().tolist() == [False, False, False, True, False]
+    assert matrix.killed_only_by('MR2').tolist() == [False, False, True, False, False]
+
+
+def test_subsumption_and_dominators():
+    matrix = make_matrix()
+    subsumes = matrix.subsumption()
+    # 02 is killed only by MR1/MG1, which also kills 01 and 04
+    assert subsumes[1, 0] and subsumes[1, 3]
+    assert not subsumes[0, 1]
+    # A surviving mutant subsumes nothing
+    assert not subsumes[4].any()
+    assert set(matrix.dominator_set().tolist()) == {1, 2}
+
+
+def test_redundant_groups():
+    # MR1/MG2 kills a subset of MR1/MG1's mutants, MR2/MG2 kills nothing
+    assert make_matrix().redundant_groups().tolist() == [1, 3]
+
+
+def test_save_load_round_trip(tmp_path):
+    matrix = make_matrix()
+    matrix.outcomes[4] = [TIMED_OUT, OVER_MEMORY]
+    path = str(tmp_path / 'matrix.npz')
+    matrix.save(path)
+    loaded = KillMatrix.load(path)
+    assert loaded.mutant_ids == matrix.mutant_ids
+    assert loaded.groups == matrix.groups
+    assert np.array_equal(loaded.kills, matrix.kills)
+    assert np.array_equal(loaded.outcomes, matrix.outcomes)
+
+
+def test_load_boolean_watchdog_file(tmp_path):
+    matrix = make_matrix()
+    watchdog = np.zeros((5, 2), dtype=bool)
+    watchdog[4, 1] = True
+    path = str(tmp_path / 'old.npz')
+    np.savez_compressed(path, kills=matrix.kills, watchdog=watchdog, mutant_ids=np.array(matrix.mutant_ids),
+                        groups=np.array([f"{mr_name}:{num}" for mr_name, num in matrix.groups]))
+    loaded = KillMatrix.load(path)
+    assert loaded.outcomes[4].tolist() == [RAN, WATCHDOG]
+    assert loaded.killed()[4]
+
+
+def test_from_results():
+    results = {(1, 'MR1'): (True, ['MG2']), (1, 'MR2'): (False, []),
+               (2, 'MR1'): (True, ['TIMEOUT']), (2, 'MR2'): (True, ['MG1 (Error)']),
+               (3, 'MR1'): (False, []), (3, 'MR2'): (True, ['OUT OF MEMORY'])}
+    matrix = KillMatrix.from_results(results, [1, 2, 3], {'MR1': [0, 0], 'MR2': [0]})
+    assert matrix.groups == [('MR1', 1), ('MR1', 2), ('MR2', 1)]
+    assert matrix.kills.tolist() == [[False, True, False], [False, False, True], [False, False, False]]
+    assert matrix.outcomes.tolist() == [[RAN, RAN], [TIMED_OUT, RAN], [RAN, OVER_MEMORY]]
+    assert matrix.killed_by_mr().tolist() == [[True, False], [True, True], [False, True]]
+
+
+def test_report_counts_timeouts_and_memory_kills_separately(capsys):
+    matrix = make_matrix()
+    matrix.outcomes[4] = [TIMED_OUT, TIMED_OUT]
+    matrix.outcomes[1, 1] = OVER_MEMORY
+    matrix.print_report()
+    out = capsys.readouterr().out
+    assert "Killed by timeout (1 mutants, 2 cells): 05" in out
+    assert "Killed by memory budget (1 mutants, 1 cells): 02" in out
+    assert "outcome not recorded" not in out
@@ -0,0 +1,56 @@
+"""
+Unit tests for test-suite minimization on hand-built kill matrices
+"""
+
+import random
+
+import numpy as np
+
+from kill_matrix import KillMatrix
+from minimize_suite import exact_cover, greedy_cover, minimize, suite_from_columns
+
+
+def covers(kills, columns):
+    """True if `columns` kill every mutant some group kills"""
+    return np.array_equal(kills[:, columns].any(axis=1), kills.any(axis=1))
+
+
+def test_exact_beats_greedy_on_the_classic_trap():
+    # Greedy takes the 4-mutant group first and then needs two more
+    kills = np.array([
+        # A  B  C
+        [1, 1, 0],
+        [1, 1, 0],
+        [1, 0, 1],
+        [1, 0, 1],
+        [0, 1, 0],
+        [0, 0, 1],
+    ], dtype=bool)
+    candidates = [0, 1, 2]
+    greedy = greedy_cover(kills, candidates)
+    exact = exact_cover(kills, candidates, len(greedy))
+    assert greedy == [0, 1, 2]
+    assert exact == [1, 2]
+    assert covers(kills, exact)
+
+
+def test_exact_is_never_larger_than_greedy():
+    rng = random.Random(7)
+    for _ in range(50):
+        kills = np.array([[rng.random() < 0.3 for _ in range(8)] for _ in range(12)], dtype=bool)
+        candidates = list(range(8))
+        greedy = greedy_cover(kills, candidates)
+        exact = exact_cover(kills, candidates, len(greedy) + 1)
+        assert covers(kills, greedy)
+        assert exact is not None and covers(kills, exact)
+        assert len(exact) <= len(greedy)
+
+
+def test_minimize_keeps_every_kill():
+    groups = [('MR1', 1), ('MR1', 2), ('MR2', 1), ('MR2', 2)]
+    kills = np.array([[1, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [1, 0, 1, 0], [0, 0, 0, 0]], dtype=bool)
+    matrix = KillMatrix([f"mutant_{i:02d}" for i in range(1, 6)], groups, kills)
+    columns = minimize(matrix)
+    assert columns == [0, 2]
+    assert covers(kills, columns)
+    assert suite_from_columns(matrix, columns) == {'MR1': [1], 'MR2': [1]}
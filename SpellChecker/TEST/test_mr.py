@@ -5,135 +5,57 @@ Metamorphic Testing for pyspellchecker known() method
 import sys
 sys.path.insert(0, '../SUT')
 from simple_spellchecker import SimpleSpellChecker
+from mr_registry import CASE_CHANGE, NON_EMPTY, PERMUTATION, UNKNOWN_ADDITION
 
-def test_mr1_permutation():
-    """MR1: Permutation Invariance - Order doesn't matter"""
+def check_relation(mr, heading, same, different):
+    """Run an MR's test groups on a fresh checker and print each verdict"""
     checker = SimpleSpellChecker()
+    number = mr.name[2:]
     
-    test_cases = [
-        (['cat', 'dog', 'bird'], ['dog', 'bird', 'cat']),
-        (['hello', 'world'], ['world', 'hello']),
-        (['test', 'python', 'code'], ['code', 'test', 'python']),
-        (['apple', 'banana'], ['banana', 'apple']),
-        (['one', 'two', 'three', 'four'], ['three', 'one', 'four', 'two']),
-        (['a', 'I', 'to'], ['to', 'I', 'a']),
-        (['apple', 'apple', 'banana'], ['banana', 'apple', 'apple'])
-    ]
-    
-    print("\n=== MR1: Permutation Invariance Testing ===")
+    print(f"\n=== {mr.name}: {heading} Testing ===")
     passed = 0
-    total = len(test_cases)
+    total = len(mr.groups)
     
-    for i, (si, fi) in enumerate(test_cases, 1):
+    for i, (si, fi) in enumerate(mr.groups, 1):
         so = checker.known(si)
         fo = checker.known(fi)
         
-        if so == fo:
-            print(f"✓ MG1_{i}: PASS - SO == FO")
+        if mr.holds_for(so, fo):
+            print(f"✓ MG{number}_{i}: PASS - {same}")
             passed += 1
         else:
-            print(f"✗ MG1_{i}: FAIL - SO != FO")
+            print(f"✗ MG{number}_{i}: FAIL - {different}")
             print(f"  SI: {si}, SO: {so}")
             print(f"  FI: {fi}, FO: {fo}")
     
-    print(f"\nMR1 Results: {passed}/{total} passed")
+    print(f"\n{mr.name} Results: {passed}/{total} passed")
     print(f"Violation Rate: {(total - passed) / total:.2%}")
     return passed == total
 
+def test_mr1_permutation():
+    """MR1: Permutation Invariance - Order doesn't matter"""
+    return check_relation(PERMUTATION, "Permutation Invariance", "SO == FO", "SO != FO")
+
 def test_mr2_unknown_addition():
     """MR2: Adding unknown word doesn't change known words"""
-    checker = SimpleSpellChecker()
-    
-    test_cases = [
-        (['hello', 'world', 'test'], ['hello', 'world', 'test', 'asdfgh']),
-        (['cat', 'dog'], ['cat', 'dog', 'xyz123']),
-        (['python', 'java'], ['python', 'java', 'qqqq']),
-        (['apple'], ['apple', 'zzzzz']),
-        (['the', 'quick', 'brown'], ['the', 'quick', 'brown', 'xjkdf']),
-        (['I', 'a', 'to'], ['I', 'a', 'to', 'xyz']),
-        (['hello', 'world'], ['hello', 'world', 'xyzabc', 'qwerty', 'asdfzxcv'])
-    ]
-    
-    print("\n=== MR2: Unknown Word Addition Testing ===")
-    passed = 0
-    total = len(test_cases)
-    
-    for i, (si, fi) in enumerate(test_cases, 1):
-        so = checker.known(si)
-        fo = checker.known(fi)
-        
-        if fo == so:
-            print(f"✓ MG2_{i}: PASS - FO == SO")
-            passed += 1
-        else:
-            print(f"✗ MG2_{i}: FAIL - FO != SO")
-            print(f"  SI: {si}, SO: {so}")
-            print(f"  FI: {fi}, FO: {fo}")
-    
-    print(f"\nMR2 Results: {passed}/{total} passed")
-    print(f"Violation Rate: {(total - passed) / total:.2%}")
-    return passed == total
+    return check_relation(UNKNOWN_ADDITION, "Unknown Word Addition", "FO == SO", "FO != SO")
 
 def test_mr3_case_invariance():
     """MR3: Case Invariance - Outputs normalized to lowercase should match"""
-    checker = SimpleSpellChecker()
-    
-    test_cases = [
-        (['Hello', 'World'], ['hello', 'world']),
-        (['PYTHON', 'java'], ['python', 'JAVA']),
-        (['Test', 'CODE'], ['test', 'code']),
-        (['Apple', 'BANANA'], ['APPLE', 'banana']),
-        (['The', 'QUICK', 'brown'], ['THE', 'quick', 'BROWN']),
-        (['A', 'I'], ['a', 'i']),
-        (['THE', 'and'], ['the', 'AND'])
-    ]
-    
-    print("\n=== MR3: Case Invariance Testing ===")
-    passed = 0
-    total = len(test_cases)
-    
-    for i, (si, fi) in enumerate(test_cases, 1):
-        so = checker.known(si)
-        fo = checker.known(fi)
-        
-        # Both should return same result (program normalizes to lowercase)
-        so_norm = {w.lower() for w in so}
-        fo_norm = {w.lower() for w in fo}
-        
-        if so_norm == fo_norm:
-            print(f"✓ MG3_{i}: PASS - SO == FO (normalized)")
-            passed += 1
-        else:
-            print(f"✗ MG3_{i}: FAIL - SO != FO")
-            print(f"  SI: {si}, SO: {so}")
-            print(f"  FI: {fi}, FO: {fo}")
-    
-    print(f"\nMR3 Results: {passed}/{total} passed")
-    print(f"Violation Rate: {(total - passed) / total:.2%}")
-    return passed == total
+    return check_relation(CASE_CHANGE, "Case Invariance", "SO == FO (normalized)", "SO != FO")
 
 def test_mr4_non_empty_property():
     """MR4: Non-Empty Property - Valid words must produce output"""
     checker = SimpleSpellChecker()
     
-    test_cases = [
-        ['hello', 'xyzabc'],
-        ['xyzabc', 'world'],
-        ['qqqq', 'test', 'zzzzz'],
-        ['python'], 
-        ['asdfgh', 'the', 'jklqw'],
-        ['a', 'xyzabc'],
-        ['I', 'qqqq'],
-    ]
-    
     print("\n=== MR4: Non-Empty Property Testing ===")
     passed = 0
-    total = len(test_cases)
+    total = len(NON_EMPTY.groups)
     
-    for i, words in enumerate(test_cases, 1):
+    for i, words in enumerate(NON_EMPTY.groups, 1):
         output = checker.known(words)
         
-        if len(output) > 0:
+        if NON_EMPTY.holds_for(output):
             print(f"✓ MG4_{i}: PASS - Output non-empty: {output}")
             passed += 1
         else:
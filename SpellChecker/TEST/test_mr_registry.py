@@ -0,0 +1,66 @@
+"""
+Unit tests for composing and registering metamorphic relations
+"""
+
+import pytest
+
+import mr_registry
+from mr_generator import GeneratedGroups
+from mr_registry import CASE_CHANGE, NON_EMPTY, PERMUTATION, MetamorphicRelation, get_mr, register
+
+SOURCES = [['hello', 'World', 'cat', 'dog', 'python'], ['one', 'two', 'three'], ['a', 'I', 'to', 'the']]
+
+
+class LowercaseChecker:
+    """Checker stub: every alphabetic word is known, in lower case"""
+
+    def known(self, words):
+        return {w.lower() for w in words if w.isalpha()}
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(mr_registry, 'REGISTRY', dict(mr_registry.REGISTRY))
+    return mr_registry.REGISTRY
+
+
+def test_then_applies_transforms_and_normalizations_in_order():
+    first = MetamorphicRelation('A', 'First', transform=lambda words, rng: words + ['a'],
+                                normalize=lambda output: {w + '1' for w in output})
+    second = MetamorphicRelation('B', 'Second', transform=lambda words, rng: words + ['b'],
+                                 normalize=lambda output: {w + '2' for w in output})
+    composed = first.then(second)
+    assert composed.name == 'A+B'
+    assert composed.follow_up(['x'], None) == ['x', 'a', 'b']
+    assert composed.normalize({'x'}) == {'x12'}
+
+
+def test_then_rejects_property_mrs():
+    with pytest.raises(ValueError):
+        PERMUTATION.then(NON_EMPTY)
+
+
+def test_follow_ups_are_deterministic_per_seed():
+    composed = PERMUTATION.then(CASE_CHANGE)
+    assert list(composed.follow_ups(SOURCES, seed=5)) == list(composed.follow_ups(SOURCES, seed=5))
+    assert list(composed.follow_ups(SOURCES, seed=5)) != list(composed.follow_ups(SOURCES, seed=6))
+
+
+def test_get_mr_registers_compositions(registry):
+    composed = get_mr('MR1+MR3')
+    assert registry['MR1+MR3'] is composed
+    assert get_mr('MR1+MR3') is composed
+    assert composed.title == "Permutation Invariance, then Case Invariance"
+
+
+def test_register_rejects_a_taken_name():
+    with pytest.raises(ValueError):
+        register(MetamorphicRelation('MR1', 'Another MR1', transform=lambda words, rng: words))
+
+
+def test_composed_mr_runs_on_generated_groups():
+    groups = GeneratedGroups('MR1+MR3', 5, seed=2)
+    checker = LowercaseChecker()
+    for source, follow in groups:
+        assert sorted(w.lower() for w in source) == sorted(w.lower() for w in follow)
+        assert get_mr('MR1+MR3').holds(checker, (source, follow))
@@ -5,157 +5,337 @@ WITH INDIVIDUAL MR ANALYSIS
 """
 
 import sys
-import importlib
+import functools
+import inspect
+import itertools
 import os
+import time
 
-# Test cases from MR testing
-MR1_TEST_CASES = [
-    (['cat', 'dog', 'bird'], ['dog', 'bird', 'cat']),
-    (['hello', 'world'], ['world', 'hello']),
-    (['test', 'python', 'code'], ['code', 'test', 'python']),
-    (['apple', 'banana'], ['banana', 'apple']),
-    (['one', 'two', 'three', 'four'], ['three', 'one', 'four', 'two']),
-    (['a', 'I', 'to'], ['to', 'I', 'a']),
-    (['apple', 'apple', 'banana'], ['banana', 'apple', 'apple'])
-]
+import numpy as np
+from spellchecker import SpellChecker
 
-MR2_TEST_CASES = [
-    (['hello', 'world', 'test'], ['hello', 'world', 'test', 'asdfgh']),
-    (['cat', 'dog'], ['cat', 'dog', 'xyz123']),
-    (['python', 'java'], ['python', 'java', 'qqqq']),
-    (['apple'], ['apple', 'zzzzz']),
-    (['the', 'quick', 'brown'], ['the', 'quick', 'brown', 'xjkdf']),
-    (['I', 'a', 'to'], ['I', 'a', 'to', 'xyz']),
-    (['hello', 'world'], ['hello', 'world', 'xyzabc', 'qwerty', 'asdfzxcv'])
-]
+from kill_history import group_order, is_group_violation, load_history, record_run, save_history
+from kill_matrix import KillMatrix
+from memory_report import (MemoryCeilingError, check_baseline as check_memory_baseline, measure_memory,
+                           print_report as print_memory_report, track_checker, traced_memory)
+from minimize_suite import load_suite, minimize, save_suite, suite_from_columns
+from mutant_equivalence import (PROBE_INPUTS, duplicate_classes, likely_equivalent,
+                                output_fingerprint)
+from mutant_loader import default_loader, get_mutant_class
+import mr_generator
+from mr_generator import GeneratedGroups, generated_suite
+import mr_registry
+from mr_registry import CASE_CHANGE, NON_EMPTY, PERMUTATION, UNKNOWN_ADDITION, get_mr
+from output_cache import CachedChecker, cache_for, format_stats, reset as reset_output_cache
+from parallel_runner import default_workers, run_jobs, run_matrix
+from result_store import ResultStore, cell_key
+from results_journal import Journal
+from score_sampling import MutantSampler, estimate_score, load_strata
+from shared_dictionary import build_checker, get_shared_word_frequency
+import unknown_words
+from unknown_words import dictionary_index, word_pool
+from timing import TimedChecker, dump_slowest, print_summary, profile_call, timing_rows, write_timings
 
-MR3_TEST_CASES = [
-    (['Hello', 'World'], ['hello', 'world']),
-    (['PYTHON', 'java'], ['python', 'JAVA']),
-    (['Test', 'CODE'], ['test', 'code']),
-    (['Apple', 'BANANA'], ['APPLE', 'banana']),
-    (['The', 'QUICK', 'brown'], ['THE', 'quick', 'BROWN']),
-    (['A', 'I'], ['a', 'i']),
-    (['THE', 'and'], ['the', 'AND'])
-]
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from generate_mutants import ast_mutations, build_meta_mutant, mutant_template, mutations
+from mutation_operators import iter_higher_order, iter_mutants
 
-MR4_TEST_CASES = [
-    ['hello', 'xyzabc'],
-    ['xyzabc', 'world'],
-    ['qqqq', 'test', 'zzzzz'],
-    ['python'], 
-    ['asdfgh', 'the', 'jklqw'],
-    ['a', 'xyzabc'],
-    ['I', 'qqqq'],
-]
+MUTATIONS = {num: (description, code) for num, description, code in mutations}
 
-def test_mutant_with_mr(mutant_num, mr_name):
-    """Test a single mutant against a specific MR"""
-    mutant_module = f"mutant_{mutant_num:02d}"
+_meta_checker = None
+_meta_entries = None
+_current_checker = (None, None)
+
+# Test cases from MR testing
+MR1_TEST_CASES = PERMUTATION.groups
+MR2_TEST_CASES = UNKNOWN_ADDITION.groups
+MR3_TEST_CASES = CASE_CHANGE.groups
+MR4_TEST_CASES = NON_EMPTY.groups
+
+MR_TEST_CASES = {
+    'MR1': MR1_TEST_CASES,
+    'MR2': MR2_TEST_CASES,
+    'MR3': MR3_TEST_CASES,
+    'MR4': MR4_TEST_CASES,
+}
+
+def check_group(checker, mr_name, case):
+    """Return True if the MR holds for one test group"""
+    return get_mr(mr_name).holds(checker, case)
+
+def check_mr(checker, mr_name, fail_fast=False, order=None, on_group=None, cases=None):
+    """Run one MR's test groups against a checker and return the violated MGs
     
-    try:
-        # Import the mutant
-        sys.path.insert(0, '../MUTANTS')
-        module = importlib.import_module(mutant_module)
-        MutantChecker = module.MutantSpellChecker
-        
-        checker = MutantChecker(language='en')
-        violations = []
-        
-        if mr_name == 'MR1':
-            # Test MR1: Permutation Invariance
-            for i, (si, fi) in enumerate(MR1_TEST_CASES, 1):
-                try:
-                    so = checker.known(si)
-                    fo = checker.known(fi)
-                    
-                    if so != fo:
-                        violations.append(f"MG{i}")
-                except Exception as e:
-                    violations.append(f"MG{i} (Error)")
-        
-        elif mr_name == 'MR2':
-            # Test MR2: Unknown Addition
-            for i, (si, fi) in enumerate(MR2_TEST_CASES, 1):
-                try:
-                    so = checker.known(si)
-                    fo = checker.known(fi)
-                    
-                    if fo != so:
-                        violations.append(f"MG{i}")
-                except Exception as e:
-                    violations.append(f"MG{i} (Error)")
-        
-        elif mr_name == 'MR3':
-            # Test MR3: Case Invariance
-            for i, (si, fi) in enumerate(MR3_TEST_CASES, 1):
-                try:
-                    so = checker.known(si)
-                    fo = checker.known(fi)
-                    
-                    # Normalize to lowercase for comparison
-                    so_norm = {w.lower() for w in so}
-                    fo_norm = {w.lower() for w in fo}
-                    
-                    if so_norm != fo_norm:
-                        violations.append(f"MG{i}")
-                except Exception as e:
-                    violations.append(f"MG{i} (Error)")
-        
-        elif mr_name == 'MR4':
-            # Test MR4: Non-Empty Property
-            for i, words in enumerate(MR4_TEST_CASES, 1):
-                try:
-                    output = checker.known(words)
-                    
-                    # Output should be non-empty AND should not contain invalid content
-                    if len(output) == 0 or '' in output:
-                        violations.append(f"MG{i}")
-                except Exception as e:
-                    violations.append(f"MG{i} (Error)")
+    Args:
+        checker: Checker whose known() is tested
+        mr_name (str): MR to check
+        fail_fast (bool): Stop at the first violated group
+        order (list): Group numbers in the order to run them (default: 1..n)
+        on_group (callable): Called as on_group(group_num, violation) after
+            each group, with the violation label or None if the MR held
+        cases (list): Test groups to run (default: MR_TEST_CASES[mr_name])
+    """
+    if cases is None:
+        cases = MR_TEST_CASES[mr_name]
+    violations = []
+    
+    if order is None:
+        order = range(1, len(cases) + 1)
+    
+    for i in order:
+        try:
+            if not check_group(checker, mr_name, cases[i - 1]):
+                violations.append(f"MG{i}")
+        except Exception as e:
+            violations.append(f"MG{i} (Error)")
         
-        # Clean up
-        if '../MUTANTS' in sys.path:
-            sys.path.remove('../MUTANTS')
-        if mutant_module in sys.modules:
-            del sys.modules[mutant_module]
+        if on_group is not None:
+            on_group(i, violations[-1] if violations and violations[-1].split()[0] == f"MG{i}" else None)
         
-        killed = len(violations) > 0
-        return killed, violations
+        if fail_fast and violations:
+            break
+    
+    return violations
+
+def get_meta_checker():
+    """Return this process's meta-mutant checker, building it on first use"""
+    global _meta_checker
+    if _meta_checker is None:
+        entries = None
+        if _meta_entries is not None:
+            entries = [(num, description, code) for num, (description, code) in _meta_entries.items()]
+        _meta_checker = build_checker(build_meta_mutant(entries))
+    return _meta_checker
+
+def use_meta_entries(entries):
+    """Point schemata mode at another list of (num, description, code) entries
+    
+    The meta-mutant is rebuilt on next use; None restores the hand-written mutations.
+    """
+    global _meta_entries, _meta_checker
+    _meta_entries = None if entries is None else {num: (d, c) for num, d, c in entries}
+    _meta_checker = None
+    reset_output_cache()
+
+def get_checker(mutant_num, schemata=False):
+    """Return a checker whose known() is that of the given mutant"""
+    if schemata:
+        checker = get_meta_checker()
+        checker.active_mutant = mutant_num
+        return checker
+    
+    # Jobs run mutant by mutant, so the mutant's MRs all share one checker
+    global _current_checker
+    if _current_checker[0] != mutant_num:
+        # Each mutant module is imported once per run and its class reused
+        MutantChecker = get_mutant_class(mutant_num)
         
+        # Attach to the shared dictionary instead of loading a new one per mutant
+        _current_checker = (mutant_num, build_checker(MutantChecker))
+    return _current_checker[1]
+
+def test_mutant_with_mr(mutant_num, mr_name, schemata=False, fail_fast=False, group_order=None,
+                        memoize=False, journal=None, timing=None, mr_cases=None):
+    """Test a single mutant against a specific MR
+    
+    In schemata mode the mutant is selected on the shared meta-mutant
+    checker instead of being imported from its own file. In fail-fast mode
+    the MR stops at the first violation, trying groups in `group_order`
+    (a dict of MR name to group numbers) when given. With memoize, known()
+    outputs are shared with the mutant's other MRs through its output cache.
+    Group and cell results are appended to `journal` as they complete.
+    A `timing` dict is filled with the checker construction time and
+    allocation, the time spent in known() and the latency of each group.
+    `mr_cases` (MR name -> test groups) replaces MR_TEST_CASES, e.g. with a
+    generated suite.
+    """
+    mutant_module = f"mutant_{mutant_num:02d}"
+    
+    try:
+        start = time.perf_counter()
+        allocated = traced_memory()
+        checker = get_checker(mutant_num, schemata)
+        if timing is not None:
+            timing['checker'] = time.perf_counter() - start
+            timing['checker_bytes'] = traced_memory() - allocated
+            track_checker(checker)
     except Exception as e:
         print(f"  Error loading mutant: {e}")
-        if '../MUTANTS' in sys.path:
-            sys.path.remove('../MUTANTS')
+        if journal is not None:
+            journal.cell(mutant_num, mr_name, False, [])
         return False, []
+    
+    if timing is not None:
+        checker = timed = TimedChecker(checker)
+    if memoize:
+        checker = CachedChecker(checker, cache_for(mutant_num))
+    
+    order = group_order.get(mr_name) if group_order else None
+    on_group = functools.partial(journal.group, mutant_num, mr_name) if journal is not None else None
+    if timing is not None:
+        on_group = _timed_groups(timing.setdefault('groups', {}), on_group)
+    violations = check_mr(checker, mr_name, fail_fast, order, on_group,
+                          mr_cases[mr_name] if mr_cases is not None else None)
+    if timing is not None:
+        timing['known'] = timed.known_time
+        timing['known_calls'] = timed.known_calls
+    
+    # Reusing the dictionary is only safe if no mutant can change it
+    get_shared_word_frequency().assert_unchanged(mutant_module)
+    
+    killed = len(violations) > 0
+    if journal is not None:
+        journal.cell(mutant_num, mr_name, killed, violations)
+    return killed, violations
 
-def run_mutation_testing():
-    """Run mutation testing on all 30 mutants with MR-specific analysis"""
-    print("=" * 80)
-    print("MUTATION TESTING WITH METAMORPHIC RELATIONS")
-    print("=" * 80)
-    print(f"Testing 30 mutants against MR1, MR2, MR3, MR4")
-    print(f"Test groups per MR: {len(MR1_TEST_CASES)} (MR1), {len(MR2_TEST_CASES)} (MR2), {len(MR3_TEST_CASES)} (MR3), {len(MR4_TEST_CASES)} (MR4)")
-    print()
+def _timed_groups(latencies, on_group=None):
+    """on_group callback recording each group's latency, chaining to `on_group`"""
+    last = [time.perf_counter()]
     
-    # Store results by MR
-    mr_results = {
-        'MR1': {'killed': [], 'survived': [], 'violations': {}},
-        'MR2': {'killed': [], 'survived': [], 'violations': {}},
-        'MR3': {'killed': [], 'survived': [], 'violations': {}},
-        'MR4': {'killed': [], 'survived': [], 'violations': {}}
-    }
+    def record(num, violation):
+        latencies[num] = time.perf_counter() - last[0]
+        if on_group is not None:
+            on_group(num, violation)
+        last[0] = time.perf_counter()
+    
+    return record
+
+def mutant_source(mutant_num, schemata=False):
+    """Source code that defines a mutant's behaviour"""
+    if schemata:
+        description, code = (MUTATIONS if _meta_entries is None else _meta_entries)[mutant_num]
+        return mutant_template.format(num=mutant_num, description=description, code=code)
+    with open(default_loader.path_for(mutant_num)) as f:
+        return f.read()
+
+def mr_definition(mr_name, groups=None, mr_cases=None):
+    """Text describing an MR's test groups and relation check
+    
+    `groups` restricts the definition to a selection of group numbers, and
+    `mr_cases` replaces MR_TEST_CASES. Generated groups are only described
+    by their parameters, so the code that generates them is part of the
+    definition too.
+    """
+    cases = (MR_TEST_CASES if mr_cases is None else mr_cases)[mr_name]
+    definition = repr(cases) + mr_name + repr(groups) + inspect.getsource(mr_registry)
+    if isinstance(cases, GeneratedGroups):
+        definition += inspect.getsource(mr_generator) + inspect.getsource(unknown_words)
+    return definition
+
+def run_cell(mutant_num, mr_name, profile=False, memory=False, memory_ceiling=None, **options):
+    """Run one (mutant, MR) cell with memoized known() outputs
+    
+    Returns (killed, violations, (cache_hits, cache_misses), timing) for the
+    cell. With profile, timing also holds the cell's raw cProfile stats, and
+    with memory its memory usage; memory_ceiling (MB) makes the cell raise
+    MemoryCeilingError when the process grows beyond it.
+    """
+    cache = cache_for(mutant_num)
+    hits, misses = cache.stats()
+    timing = {}
+    run = functools.partial(test_mutant_with_mr, mutant_num, mr_name, memoize=True, timing=timing, **options)
+    if memory or memory_ceiling:
+        run = functools.partial(measure_memory, run, timing, f"mutant_{mutant_num:02d}/{mr_name}", memory_ceiling)
+    start = time.perf_counter()
+    if profile:
+        (killed, violations), timing['profile'] = profile_call(run)
+    else:
+        killed, violations = run()
+    timing['cell'] = time.perf_counter() - start
+    return killed, violations, (cache.hits - hits, cache.misses - misses), timing
+
+def watchdog_result(cell, outcome):
+    """Result of a cell whose worker was killed by the watchdog
+    
+    A mutant that hangs or exhausts memory is counted as killed, with the
+    watchdog outcome (e.g. TIMEOUT) in place of violated test groups.
+    """
+    return True, [outcome], (0, 0)
+
+def watchdog_outcome(violations):
+    """The watchdog outcome among a cell's violations, or None"""
+    return next((v for v in violations if not is_group_violation(v)), None)
+
+def probe_mutant(mutant_num, job_name, probes, schemata=False):
+    """Output fingerprint of a mutant on the probes, or None if it cannot be loaded"""
+    try:
+        return output_fingerprint(get_checker(mutant_num, schemata), probes)
+    except Exception:
+        return None
+
+def find_equivalent_mutants(mutant_nums, schemata=False, workers=1, timeout=None, memory_limit=None,
+                            mr_cases=None):
+    """Detect duplicate and likely-equivalent mutants before execution
+    
+    Prints the findings and returns {duplicate: representative} for the
+    mutants that do not need to be executed. The probes are the inputs of
+    the test groups in `mr_cases` (default: MR_TEST_CASES) and run under the
+    same watchdog as the cells; mutants it kills are reported as not
+    fingerprinted.
+    """
+    sources = {i: mutant_source(i, schemata) for i in mutant_nums}
+    representative = duplicate_classes(sources)
+    duplicates = {i: rep for i, rep in representative.items() if rep != i}
+    
+    probes = list(PROBE_INPUTS)
+    for mr_name, cases in (MR_TEST_CASES if mr_cases is None else mr_cases).items():
+        for case in cases:
+            probes.extend([case] if get_mr(mr_name).is_property else case)
+    
+    probe = functools.partial(probe_mutant, probes=probes, schemata=schemata)
+    jobs = [(i, 'probes') for i in mutant_nums if i not in duplicates]
+    results = run_jobs(probe, jobs, workers, timeout=timeout, memory_limit=memory_limit)
+    fingerprints = {i: fp for (i, _), fp in results.items() if isinstance(fp, tuple)}
+    overran = {i: outcome for (i, _), outcome in results.items() if isinstance(outcome, str)}
+    original = output_fingerprint(build_checker(SpellChecker), probes)
+    as_original, same_as = likely_equivalent(fingerprints, original)
     
-    # Test each mutant against each MR
     print("-" * 80)
-    print("TESTING MUTANTS AGAINST EACH MR")
+    print("DUPLICATE AND EQUIVALENT MUTANTS")
     print("-" * 80)
+    print(f"Duplicates (identical known() after normalization, not executed): {len(duplicates)}")
+    for i, rep in duplicates.items():
+        print(f"  {i:02d} -> duplicate of {rep:02d}")
+    print(f"Likely equivalent to the original on {len(probes)} probes: "
+          f"{', '.join(f'{i:02d}' for i in as_original) or 'none'}")
+    print(f"Same probe outputs as an earlier mutant: {len(same_as)}")
+    for i, other in same_as.items():
+        print(f"  {i:02d} ~ {other:02d}")
+    if overran:
+        print(f"Not fingerprinted (killed by the watchdog): {len(overran)}")
+        for i, outcome in overran.items():
+            print(f"  {i:02d}: {outcome}")
+    print()
+    
+    return duplicates
+
+def report_results(matrix, group_counts, duplicates, mr_cases=None):
+    """Print per-mutant results and the summary, and write mutation_test_results.txt
+    
+    Args:
+        matrix (dict): (mutant_num, mr_name) -> (killed, violations, cache stats)
+        group_counts (dict): Number of test groups run per MR
+        duplicates (dict): Duplicate mutant -> representative it was not executed for
+        mr_cases (dict): MR name -> test groups of the run (default: MR_TEST_CASES)
+    
+    Returns:
+        tuple: (mr_results, combined_score, kill_matrix)
+    """
+    if mr_cases is None:
+        mr_cases = MR_TEST_CASES
+    mr_names = list(mr_cases)
+    
+    # Store results by MR
+    mr_results = {mr_name: {'killed': [], 'survived': [], 'violations': {}} for mr_name in mr_names}
     
     for i in range(1, 31):
-        print(f"\n[Mutant {i:02d}]")
+        if i in duplicates:
+            print(f"\n[Mutant {i:02d}] duplicate of mutant_{duplicates[i]:02d} (not executed)")
+        else:
+            print(f"\n[Mutant {i:02d}]")
         
-        for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
-            killed, violations = test_mutant_with_mr(i, mr_name)
+        for mr_name in mr_names:
+            killed, violations = matrix[(i, mr_name)][:2]
             
             mutant_id = f"mutant_{i:02d}"
             
@@ -170,10 +350,13 @@ def run_mutation_testing():
             
             mr_results[mr_name]['violations'][mutant_id] = violations
             
-            total_tests = len(MR1_TEST_CASES) if mr_name == 'MR1' else len(MR2_TEST_CASES) if mr_name == 'MR2' else len(MR3_TEST_CASES) if mr_name == 'MR3' else len(MR4_TEST_CASES)
+            total_tests = group_counts[mr_name]
             violation_rate = (len(violations) / total_tests * 100) if total_tests > 0 else 0
             
-            print(f"  {symbol} {mr_name}: {status:8s} ({len(violations)}/{total_tests} violations, {violation_rate:.1f}%)")
+            if watchdog_outcome(violations):
+                print(f"  ⧗ {mr_name}: {status:8s} (by {watchdog_outcome(violations)})")
+            else:
+                print(f"  {symbol} {mr_name}: {status:8s} ({len(violations)}/{total_tests} violations, {violation_rate:.1f}%)")
     
     # Print summary results
     print("\n" + "=" * 80)
@@ -183,20 +366,18 @@ def run_mutation_testing():
     print("\n1. MUTATION SCORES BY METAMORPHIC RELATION")
     print("-" * 80)
     
-    for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
+    for mr_name in mr_names:
         killed_count = len(mr_results[mr_name]['killed'])
         survived_count = len(mr_results[mr_name]['survived'])
         mutation_score = (killed_count / 30) * 100
         
         # Calculate average violation rate
-        total_violations = sum(len(v) for v in mr_results[mr_name]['violations'].values())
-        total_tests = len(MR1_TEST_CASES) if mr_name == 'MR1' else len(MR2_TEST_CASES) if mr_name == 'MR2' else len(MR3_TEST_CASES) if mr_name == 'MR3' else len(MR4_TEST_CASES)
-        avg_violation_rate = (total_violations / (30 * total_tests)) * 100
+        total_violations = sum(len([g for g in v if is_group_violation(g)])
+                               for v in mr_results[mr_name]['violations'].values())
+        total_tests = group_counts[mr_name]
+        avg_violation_rate = (total_violations / (30 * total_tests)) * 100 if total_tests > 0 else 0
         
-        print(f"\n{mr_name} (Permutation Invariance):" if mr_name == 'MR1' else 
-              f"\n{mr_name} (Unknown Addition):" if mr_name == 'MR2' else
-              f"\n{mr_name} (Case Invariance):" if mr_name == 'MR3' else
-              f"\n{mr_name} (Non-Empty Property):")
+        print(f"\n{mr_name} ({get_mr(mr_name).title}):")
         print(f"  Killed:              {killed_count}/30 ({mutation_score:.2f}%)")
         print(f"  Survived:            {survived_count}/30 ({100-mutation_score:.2f}%)")
         print(f"  Avg Violation Rate:  {avg_violation_rate:.2f}%")
@@ -206,9 +387,10 @@ def run_mutation_testing():
     print("\n2. COMBINED EFFECTIVENESS")
     print("-" * 80)
     
-    all_killed = set()
-    for mr_name in mr_results:
-        all_killed.update(mr_results[mr_name]['killed'])
+    kill_matrix = KillMatrix.from_results(matrix, range(1, 31), mr_cases)
+    mutant_ids = np.array(kill_matrix.mutant_ids)
+    
+    all_killed = set(mutant_ids[kill_matrix.killed()])
     
     combined_killed = len(all_killed)
     combined_score = (combined_killed / 30) * 100
@@ -229,9 +411,7 @@ def run_mutation_testing():
     print("-" * 80)
     
     # Find mutants killed by all MRs
-    killed_by_all = set(mr_results['MR1']['killed'])
-    for mr_name in ['MR2', 'MR3', 'MR4']:
-        killed_by_all &= set(mr_results[mr_name]['killed'])
+    killed_by_all = set(mutant_ids[kill_matrix.killed_by_all_mrs()])
     
     print(f"\nMutants killed by ALL MRs: {len(killed_by_all)}/30")
     if killed_by_all:
@@ -240,11 +420,8 @@ def run_mutation_testing():
     
     # Find mutants killed by only one MR
     print()
-    for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
-        only_this_mr = set(mr_results[mr_name]['killed'])
-        for other_mr in ['MR1', 'MR2', 'MR3', 'MR4']:
-            if other_mr != mr_name:
-                only_this_mr -= set(mr_results[other_mr]['killed'])
+    for mr_name in mr_names:
+        only_this_mr = set(mutant_ids[kill_matrix.killed_only_by(mr_name)])
         
         if only_this_mr:
             only_ids = ', '.join([m.split('_')[1] for m in sorted(only_this_mr)])
@@ -257,7 +434,7 @@ def run_mutation_testing():
     print(f"\n{'MR':<10} {'Killed':<15} {'Survived':<15} {'Mutation Score':<20}")
     print("-" * 80)
     
-    for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
+    for mr_name in mr_names:
         killed_count = len(mr_results[mr_name]['killed'])
         survived_count = len(mr_results[mr_name]['survived'])
         mutation_score = (killed_count / 30) * 100
@@ -274,7 +451,7 @@ def run_mutation_testing():
         
         f.write("INDIVIDUAL MR RESULTS:\n")
         f.write("-" * 80 + "\n")
-        for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
+        for mr_name in mr_names:
             f.write(f"\n{mr_name}:\n")
             f.write(f"  Mutation Score: {(len(mr_results[mr_name]['killed'])/30)*100:.2f}%\n")
             f.write(f"  Killed ({len(mr_results[mr_name]['killed'])}): ")
@@ -294,14 +471,583 @@ def run_mutation_testing():
         for i in range(1, 31):
             mutant_id = f"mutant_{i:02d}"
             f.write(f"\nMutant {i:02d}:\n")
-            for mr_name in ['MR1', 'MR2', 'MR3', 'MR4']:
+            if i in duplicates:
+                f.write(f"  Duplicate of mutant_{duplicates[i]:02d} (not executed)\n")
+            for mr_name in mr_names:
                 status = "KILLED" if mutant_id in mr_results[mr_name]['killed'] else "SURVIVED"
                 violations = mr_results[mr_name]['violations'].get(mutant_id, [])
+                if watchdog_outcome(violations):
+                    f.write(f"  {mr_name}: KILLED BY {watchdog_outcome(violations)}\n")
+                    continue
                 f.write(f"  {mr_name}: {status:8s} - Violations: {len(violations)} {violations}\n")
     
     print("\nResults saved to 'mutation_test_results.txt'")
     
+    return mr_results, combined_score, kill_matrix
+
+def report_from_journal(journal=None):
+    """Rebuild the results summary and mutation_test_results.txt from the journal alone
+    
+    Returns:
+        tuple: (mr_results, combined_score), or None if the journal is incomplete
+    """
+    journal = journal or Journal()
+    config, cells = journal.read()
+    
+    print("=" * 80)
+    print("MUTATION TESTING REPORT FROM JOURNAL")
+    print("=" * 80)
+    mr_names = list(config['group_counts']) if config is not None else list(MR_TEST_CASES)
+    missing = [(i, mr_name) for i in range(1, 31) for mr_name in mr_names
+               if (i, mr_name) not in cells]
+    if config is None or missing:
+        print(f"Journal '{journal.path}' is incomplete: {len(missing)}/{30 * len(mr_names)} cells missing")
+        print("Finish the run with --resume first")
+        return None
+    if config['fail_fast']:
+        print("Fail-fast run: violation counts are lower bounds")
+    
+    # Violations of a generated run refer to the groups of its generated suite
+    mr_cases = generated_suite(mr_names, *config['generated']) if config.get('generated') else None
+    matrix = {cell: (record['killed'], record['violations'], (0, 0)) for cell, record in cells.items()}
+    duplicates = {i: record['duplicate_of'] for (i, _), record in cells.items() if 'duplicate_of' in record}
+    mr_results, combined_score, _ = report_results(matrix, config['group_counts'], duplicates, mr_cases)
+    return mr_results, combined_score
+
+def run_mutation_testing(workers=1, schemata=False, import_times=False, fail_fast=False,
+                         cache_stats=False, incremental=False, analytics=False, suite='full',
+                         minimize_suite=False, dedupe=False, timeout=None, memory_limit=None,
+                         resume=False, timings=False, profile=0, memory_report=False,
+                         memory_ceiling=None, generated=0, seed=0, prune_store=False, compose=()):
+    """Run mutation testing on all 30 mutants with MR-specific analysis
+    
+    Args:
+        workers (int): Number of worker processes for the mutant x MR matrix
+        schemata (bool): Switch mutants on one compiled meta-mutant instead of importing files
+        import_times (bool): Print the import time of each mutant module
+        fail_fast (bool): Stop each MR at its first violation, trying the
+            historically most effective groups first. Violation counts are
+            then lower bounds, so the kill history is not updated.
+        cache_stats (bool): Print hit/miss counts of the known() output cache
+        incremental (bool): Reuse stored results of unchanged cells (ignored with fail_fast)
+        prune_store (bool): Drop stored results that this run did not use
+        analytics (bool): Print kill-matrix analytics and save the matrix to kill_matrix.npz
+        suite (str): 'full' for every test group, 'fast' for the minimized
+            selection saved in fast_suite.json
+        minimize_suite (bool): Compute the smallest group subset with the same
+            combined score and save it as the fast suite (full-suite runs only)
+        dedupe (bool): Execute one representative per class of duplicate
+            mutants and report the others as pointers to it
+        timeout (float): Wall-clock budget per (mutant, MR) cell in seconds;
+            cells run in watchdog worker processes and overruns count as
+            killed by timeout
+        memory_limit (float): Memory budget per cell in MB, enforced the same way
+        resume (bool): Skip cells already finished in the journal of an
+            interrupted run with the same options
+        timings (bool): Export per-cell timings to mutation_timings.csv/.json
+            and print a breakdown of where the time went
+        profile (int): Run cells under cProfile and dump the N slowest mutants
+        memory_report (bool): Trace peak and retained memory per cell and
+            checker instance and print a per-mutant memory report
+        memory_ceiling (float): RSS ceiling in MB for every process; the run
+            fails with MemoryCeilingError and a diagnosis when it is exceeded
+        generated (int): Replace the hand-written groups of every MR with this
+            many groups generated from the dictionary (see mr_generator.py)
+        seed (int): Seed of the generated groups
+        compose (list): Composed MRs to run as well, e.g. ['MR1+MR3'] (see
+            mr_registry.get_mr); they have no hand-written groups, so this
+            needs generated groups
+    """
+    if compose and not generated:
+        raise ValueError("Composed MRs have no hand-written groups; run them with generated groups")
+    # Load what the cells share up front: forked workers inherit it, and the
+    # memory accounting of the first traced cell does not include it
+    get_shared_word_frequency()
+    mr_cases = MR_TEST_CASES
+    if generated:
+        mr_cases = generated_suite(list(MR_TEST_CASES) + [get_mr(name).name for name in compose], generated, seed)
+        word_pool()
+        dictionary_index()
+    check_memory_baseline(memory_ceiling)
+    watchdog = {}
+    if timeout or memory_limit:
+        watchdog = {'timeout': timeout, 'memory_limit': memory_limit, 'on_kill': watchdog_result}
+    selected = load_suite() if suite == 'fast' and not generated else None
+    group_counts = {mr_name: len(selected[mr_name]) if selected else len(cases)
+                    for mr_name, cases in mr_cases.items()}
+    mr_names = list(mr_cases)
+    
+    print("=" * 80)
+    print("MUTATION TESTING WITH METAMORPHIC RELATIONS")
+    print("=" * 80)
+    print(f"Testing 30 mutants against {', '.join(mr_names)}")
+    print(f"Test groups per MR: {', '.join(f'{len(cases)} ({mr_name})' for mr_name, cases in mr_cases.items())}")
+    if generated:
+        print(f"Generated suite: {generated} groups per MR sampled from the dictionary (seed {seed})")
+    if selected:
+        print(f"Fast suite: {sum(group_counts.values())} groups selected "
+              f"({', '.join(f'{count} ({mr_name})' for mr_name, count in group_counts.items())})")
+    if fail_fast:
+        print("Fail-fast mode: each MR stops at its first violation (violation counts are lower bounds)")
+    if watchdog:
+        budget = [f"{timeout:g}s" if timeout else None, f"{memory_limit:g} MB" if memory_limit else None]
+        print(f"Watchdog: {', '.join(b for b in budget if b)} per mutant x MR cell")
+    print()
+    
+    duplicates = find_equivalent_mutants(range(1, 31), schemata, workers, timeout, memory_limit,
+                                         mr_cases) if dedupe else {}
+    executed = [i for i in range(1, 31) if i not in duplicates]
+    
+    # Test each mutant against each MR
+    print("-" * 80)
+    print("TESTING MUTANTS AGAINST EACH MR")
+    print("-" * 80)
+    
+    if not schemata:
+        # Import in the parent so forked workers inherit the loaded classes
+        default_loader.load_all(range(1, 31))
+    
+    history = load_history()
+    group_orders = None
+    if fail_fast and not generated:
+        # The kill history is about the hand-written groups; generated ones run in order
+        group_orders = {mr_name: group_order(history, mr_name, len(mr_cases[mr_name]))
+                        for mr_name in mr_cases}
+    if selected:
+        # Run only the selected groups, keeping the fail-fast order if any
+        group_orders = {mr_name: [num for num in (group_orders[mr_name] if group_orders else sorted(nums))
+                                  if num in nums]
+                        for mr_name, nums in selected.items()}
+    
+    journal = Journal()
+    config = {'schemata': schemata, 'fail_fast': fail_fast, 'suite': selected,
+              'group_counts': group_counts, 'dedupe': dedupe,
+              'generated': [generated, seed] if generated else None}
+    matrix = {}
+    cells = journal.resume(config) if resume else None
+    if cells is not None:
+        matrix = {cell: (record['killed'], record['violations'], (0, 0))
+                  for cell, record in cells.items() if 'duplicate_of' not in record}
+        print(f"Resuming: {len(matrix)} finished cells read from the journal")
+    else:
+        if resume:
+            print("Resume: no journal of a run with these options, starting a new one")
+        journal.start(config)
+    
+    test_func = functools.partial(run_cell, schemata=schemata, fail_fast=fail_fast,
+                                  group_order=group_orders, journal=journal, profile=bool(profile),
+                                  memory=memory_report, memory_ceiling=memory_ceiling, mr_cases=mr_cases)
+    pending = [(i, mr_name) for i in executed for mr_name in mr_names
+               if (i, mr_name) not in matrix]
+    
+    if incremental and not fail_fast:
+        # Only re-run cells whose mutant source, MR definition or library version changed
+        store = ResultStore()
+        keys = {(i, mr_name): cell_key(mutant_source(i, schemata),
+                                       mr_definition(mr_name, selected[mr_name] if selected else None, mr_cases))
+                for i in executed for mr_name in mr_names}
+        reused = 0
+        for cell in pending:
+            stored = store.get(keys[cell])
+            if stored is not None:
+                matrix[cell] = (stored[0], stored[1], (0, 0))
+                journal.cell(*cell, stored[0], stored[1])
+                reused += 1
+        stale = [cell for cell in pending if cell not in matrix]
+        print(f"Incremental run: {len(stale)}/{len(keys)} cells stale, {reused} reused")
+        
+        matrix.update(run_jobs(test_func, stale, workers, **watchdog))
+        for cell in keys:
+            # Timeouts depend on the machine, so they are re-run next time
+            if watchdog_outcome(matrix[cell][1]) is None:
+                store.put(keys[cell], matrix[cell][0], matrix[cell][1])
+        store.save(prune=prune_store)
+    else:
+        stale = pending
+        matrix.update(run_jobs(test_func, stale, workers, **watchdog))
+    
+    # Watchdog kills happen in this process, so they are journalled here
+    for cell in stale:
+        if watchdog_outcome(matrix[cell][1]):
+            journal.cell(*cell, *matrix[cell][:2])
+    
+    # Cells only compare the store's size and scalars; check every frequency once
+    get_shared_word_frequency().assert_unchanged(full=True)
+    
+    # Duplicates share their representative's results
+    for i, rep in duplicates.items():
+        for mr_name in mr_names:
+            matrix[(i, mr_name)] = matrix[(rep, mr_name)][:2] + ((0, 0),)
+            journal.cell(i, mr_name, *matrix[(i, mr_name)][:2], duplicate_of=rep)
+    
+    if not fail_fast and not selected and not generated:
+        for mr_name, cases in mr_cases.items():
+            record_run(history, mr_name, len(cases),
+                       {i: matrix[(i, mr_name)][1] for i in range(1, 31)})
+        save_history(history)
+    
+    mr_results, combined_score, kill_matrix = report_results(matrix, group_counts, duplicates, mr_cases)
+    
+    if import_times and not schemata:
+        default_loader.print_import_times()
+    
+    if analytics:
+        kill_matrix.print_report()
+        kill_matrix.save('kill_matrix.npz')
+        print("\nKill matrix saved to 'kill_matrix.npz'")
+    
+    if minimize_suite:
+        print("\nTEST-SUITE MINIMIZATION")
+        print("-" * 80)
+        if fail_fast or selected or generated:
+            print("Skipped: minimization needs a full hand-written suite run without fail-fast")
+        else:
+            columns = minimize(kill_matrix)
+            save_suite(suite_from_columns(kill_matrix, columns))
+            print(f"Fast suite: {len(columns)}/{len(kill_matrix.groups)} groups, "
+                  f"combined score {combined_score:.2f}% preserved")
+            print(f"  Groups: {', '.join(kill_matrix.group_label(j) for j in columns)}")
+            print("Saved to 'fast_suite.json'")
+    
+    if timings:
+        rows = timing_rows(matrix, default_loader.import_times)
+        write_timings(rows)
+        print_summary(rows, default_loader.import_times)
+        print("Timings saved to 'mutation_timings.csv' and 'mutation_timings.json'")
+    
+    if profile:
+        dump_slowest(matrix, profile)
+    
+    if memory_report:
+        print_memory_report(matrix, memory_ceiling)
+    
+    if cache_stats:
+        print("\nKNOWN() OUTPUT CACHE")
+        print("-" * 80)
+        for mr_name in mr_names:
+            hits = sum(matrix[(i, mr_name)][2][0] for i in range(1, 31))
+            misses = sum(matrix[(i, mr_name)][2][1] for i in range(1, 31))
+            print(f"  {mr_name}: {format_stats(hits, misses)}")
+        hits = sum(cell[2][0] for cell in matrix.values())
+        misses = sum(cell[2][1] for cell in matrix.values())
+        print(f"  Total: {format_stats(hits, misses)}")
+    
     return mr_results, combined_score
 
+def execute_entries(entries, workers=1, store=None):
+    """Run every MR against generated mutants without writing them to files
+    
+    Args:
+        entries (list): (num, description, code) tuples compiled into one meta-mutant
+        workers (int): Number of worker processes
+        store (ResultStore): Optional store of previously computed cells
+    
+    Returns:
+        dict: (mutant_num, mr_name) -> (killed, violations, cache stats)
+    """
+    use_meta_entries(entries)
+    # Compile in the parent so forked workers inherit the meta-mutant
+    get_meta_checker()
+    
+    cells = [(num, mr_name) for num, _, _ in entries for mr_name in MR_TEST_CASES]
+    matrix = {}
+    keys = {}
+    if store is not None:
+        keys = {cell: cell_key(mutant_source(cell[0], True), mr_definition(cell[1])) for cell in cells}
+        for cell, key in keys.items():
+            stored = store.get(key)
+            if stored is not None:
+                matrix[cell] = (stored[0], stored[1], (0, 0))
+        cells = [cell for cell in cells if cell not in matrix]
+    
+    test_func = functools.partial(run_cell, schemata=True)
+    executed = run_jobs(test_func, cells, workers)
+    get_shared_word_frequency().assert_unchanged(full=True)
+    if store is not None:
+        for cell, result in executed.items():
+            store.put(keys[cell], result[0], result[1])
+    matrix.update(executed)
+    return matrix
+
+def run_higher_order_testing(order=2, max_mutants=200, time_budget=None, seed=0, workers=1,
+                             incremental=False, batch_size=100, prune_store=False):
+    """Sample higher-order mutants of known() and test them against all MRs
+    
+    First-order mutants come from the AST operator engine. Higher-order
+    mutants are sampled within the count/time budget and executed batch by
+    batch through a compiled meta-mutant, so nothing is written to disk.
+    A higher-order mutant is subsuming if it is killed, but by fewer test
+    groups than the union of its parts, and strongly subsuming if every
+    group that kills it also kills each of its parts.
+    
+    Args:
+        order (int): Number of first-order mutants combined
+        max_mutants (int): Count budget for sampled mutants (None = no limit)
+        time_budget (float): Wall-clock budget in seconds (None = no limit)
+        seed (int): Random seed for sampling
+        workers (int): Number of worker processes
+        incremental (bool): Reuse stored results of unchanged cells
+        batch_size (int): Mutants compiled into each meta-mutant
+        prune_store (bool): Drop stored results that this run did not use
+    """
+    print("=" * 80)
+    print("HIGHER-ORDER MUTATION TESTING WITH METAMORPHIC RELATIONS")
+    print("=" * 80)
+    budget = f"{max_mutants} mutants" if max_mutants is not None else "no count limit"
+    if time_budget is not None:
+        budget += f", {time_budget:g}s"
+    print(f"Order: {order}, budget: {budget}, seed: {seed}")
+    
+    start = time.perf_counter()
+    store = ResultStore() if incremental else None
+    first_order = list(iter_mutants())
+    fom_nums = [m.num for m in first_order]
+    fom_matrix = execute_entries(list(ast_mutations(first_order)), workers, store)
+    fom_kills = KillMatrix.from_results(fom_matrix, fom_nums, MR_TEST_CASES)
+    part_kills = dict(zip(fom_nums, fom_kills.kills))
+    print(f"First-order mutants: {len(first_order)} "
+          f"({int(fom_kills.killed().sum())} killed)")
+    
+    rows = []
+    sampled = []
+    homs = iter_higher_order(first_order, order, max_mutants, time_budget, seed)
+    while True:
+        batch = list(itertools.islice(homs, batch_size))
+        if not batch:
+            break
+        matrix = execute_entries(list(ast_mutations(batch)), workers, store)
+        rows.append(KillMatrix.from_results(matrix, [m.num for m in batch], MR_TEST_CASES).kills)
+        sampled.extend(batch)
+    use_meta_entries(None)
+    if store is not None:
+        store.save(prune=prune_store)
+    elapsed = time.perf_counter() - start
+    
+    total = len(sampled)
+    groups = fom_kills.groups
+    kills = np.vstack(rows) if rows else np.zeros((0, len(groups)), dtype=bool)
+    hom_kills = KillMatrix([m.mutant_id for m in sampled], groups, kills)
+    
+    killed = kills.any(axis=1)
+    union = np.array([np.any([part_kills[p] for p in m.parts], axis=0) for m in sampled]).reshape(kills.shape)
+    inter = np.array([np.all([part_kills[p] for p in m.parts], axis=0) for m in sampled]).reshape(kills.shape)
+    subsuming = killed & (kills.sum(axis=1) < union.sum(axis=1))
+    strongly = killed & ~(kills & ~inter).any(axis=1)
+    masking = ~killed & union.any(axis=1)
+    
+    def share(mask):
+        count = int(mask.sum())
+        return f"{count}/{total} ({(count / total * 100) if total else 0:.2f}%)"
+    
+    print(f"Higher-order mutants sampled: {total} in {elapsed:.2f}s")
+    print()
+    print("-" * 80)
+    print("RESULTS SUMMARY")
+    print("-" * 80)
+    print(f"  Killed:               {share(killed)}")
+    print(f"  Survived:             {share(~killed)}")
+    print(f"  Subsuming:            {share(subsuming)}")
+    print(f"  Strongly subsuming:   {share(strongly)}")
+    print(f"  Masking (part killed, HOM survives): {share(masking)}")
+    if total:
+        print()
+        for mr_name, score in hom_kills.mr_scores().items():
+            print(f"  {mr_name} score: {score * 100:.2f}%")
+    
+    if strongly.any():
+        print("\nStrongly subsuming higher-order mutants:")
+        for i in np.flatnonzero(strongly)[:10]:
+            print(f"  {sampled[i].mutant_id}: {sampled[i].full_description}")
+    print("=" * 80)
+    
+    return hom_kills, sampled
+
+def run_sampled_testing(sample_size=10, target_width=None, confidence=0.95, stratified=True,
+                        seed=0, workers=1, schemata=False):
+    """Estimate mutation scores from a sample of mutants
+    
+    Mutants are drawn in rounds of `sample_size`. With a target width,
+    rounds continue until every confidence interval (per MR and combined)
+    is at most that wide, or every mutant has been run.
+    
+    Args:
+        sample_size (int): Mutants drawn per round
+        target_width (float): Stop once all intervals are this narrow
+            (fraction, e.g. 0.2 for +/-10 points); None runs a single round
+        confidence (float): Confidence level of the intervals
+        stratified (bool): Stratify the sample by mutation operator from mutants.csv
+        seed (int): Random seed
+        workers (int): Number of worker processes
+        schemata (bool): Switch mutants on one compiled meta-mutant instead of importing files
+    
+    Returns:
+        dict: MR name (or 'COMBINED') -> (estimate, lower, upper)
+    """
+    strata = load_strata()
+    sampler = MutantSampler(strata, stratified, seed)
+    mr_names = list(MR_TEST_CASES)
+    
+    print("=" * 80)
+    print("SAMPLED MUTATION TESTING WITH METAMORPHIC RELATIONS")
+    print("=" * 80)
+    print(f"Population: {sampler.population} mutants of {len(strata)} operator families "
+          f"in {len(sampler.strata)} strata "
+          f"({'stratified' if stratified else 'simple random'} sampling, seed {seed})")
+    if target_width is not None:
+        print(f"Target: {confidence * 100:g}% intervals at most {target_width * 100:.1f} points wide")
+    print()
+    
+    start = time.perf_counter()
+    test_func = functools.partial(run_cell, schemata=schemata)
+    matrix = {}
+    round_num = 0
+    while True:
+        round_num += 1
+        batch = sampler.draw(sample_size)
+        if len(batch) > sample_size:
+            print(f"Round {round_num} draws {len(batch)} mutants, not {sample_size}: "
+                  f"the first round takes two mutants from each of the {len(sampler.strata)} strata")
+        if not schemata:
+            default_loader.load_all(batch)
+        matrix.update(run_matrix(test_func, batch, mr_names, workers))
+        
+        estimates = {}
+        for mr_name in mr_names:
+            kills = {i: matrix[(i, mr_name)][0] for i in sampler.sampled}
+            estimates[mr_name] = estimate_score(sampler.strata, kills, confidence)
+        combined = {i: any(matrix[(i, mr_name)][0] for mr_name in mr_names) for i in sampler.sampled}
+        estimates['COMBINED'] = estimate_score(sampler.strata, combined, confidence)
+        
+        width = max(upper - lower for _, lower, upper in estimates.values())
+        print(f"Round {round_num}: {len(sampler.sampled)}/{sampler.population} mutants sampled, "
+              f"widest interval {width * 100:.1f} points")
+        if target_width is None or width <= target_width or sampler.exhausted():
+            break
+    get_shared_word_frequency().assert_unchanged(full=True)
+    elapsed = time.perf_counter() - start
+    
+    print("\n" + "-" * 80)
+    print(f"ESTIMATED MUTATION SCORES ({confidence * 100:g}% confidence)")
+    print("-" * 80)
+    print(f"\n{'MR':<10} {'Estimate':<12} {'Interval':<20}")
+    print("-" * 80)
+    for name, (estimate, lower, upper) in estimates.items():
+        print(f"{name:<10} {f'{estimate * 100:.2f}%':<12} [{lower * 100:.2f}%, {upper * 100:.2f}%]")
+    print("-" * 80)
+    print(f"Sampled {len(sampler.sampled)}/{sampler.population} mutants in {elapsed:.2f}s")
+    if target_width is not None and width > target_width:
+        print("Target width not reached: every mutant was sampled")
+    print("=" * 80)
+    
+    return estimates
+
 if __name__ == "__main__":
-    results, score = run_mutation_testing()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Mutation testing with metamorphic relations")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes for the mutant x MR matrix (0 = one per CPU)")
+    parser.add_argument('--schemata', action='store_true',
+                        help="run mutants from a single compiled meta-mutant instead of MUTANTS/ files")
+    parser.add_argument('--import-times', action='store_true',
+                        help="print the import time of each mutant module")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop each MR at its first violation, most effective groups first")
+    parser.add_argument('--cache-stats', action='store_true',
+                        help="print hit/miss statistics of the known() output cache")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only re-run cells whose mutant, MR cases or pyspellchecker version changed")
+    parser.add_argument('--prune-store', action='store_true',
+                        help="with --incremental, drop stored results not used by this run")
+    parser.add_argument('--analytics', action='store_true',
+                        help="print subsumption, dominator and redundant-group analytics")
+    parser.add_argument('--suite', choices=['full', 'fast'], default='full',
+                        help="test groups to run: all, or the minimized selection in fast_suite.json")
+    parser.add_argument('--minimize', action='store_true',
+                        help="save the smallest group subset with the same combined score as the fast suite")
+    parser.add_argument('--dedupe', action='store_true',
+                        help="run one representative per class of duplicate mutants")
+    parser.add_argument('--higher-order', type=int, metavar='K',
+                        help="sample K-order mutants from the AST operator engine instead of MUTANTS/")
+    parser.add_argument('--budget', type=int, default=200,
+                        help="maximum number of higher-order mutants to sample (default: 200)")
+    parser.add_argument('--time-budget', type=float,
+                        help="stop sampling higher-order mutants after this many seconds")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="random seed for higher-order sampling, score sampling and generated groups")
+    parser.add_argument('--sample', type=int, metavar='N',
+                        help="estimate scores from a sample, drawing N mutants per round")
+    parser.add_argument('--target-width', type=float,
+                        help="keep sampling until every confidence interval is this wide (e.g. 0.2)")
+    parser.add_argument('--confidence', type=float, default=0.95,
+                        help="confidence level of the sampled score intervals (default: 0.95)")
+    parser.add_argument('--no-stratify', action='store_true',
+                        help="simple random sample instead of stratifying by mutation operator")
+    parser.add_argument('--timeout', type=float,
+                        help="wall-clock budget per mutant x MR cell in seconds (runs cells in watchdog workers)")
+    parser.add_argument('--memory-limit', type=float, metavar='MB',
+                        help="memory budget per mutant x MR cell in MB (runs cells in watchdog workers)")
+    parser.add_argument('--resume', action='store_true',
+                        help="skip cells already finished in the journal of an interrupted run")
+    parser.add_argument('--report', action='store_true',
+                        help="rebuild the summary from mutation_journal.jsonl without running mutants")
+    parser.add_argument('--timings', action='store_true',
+                        help="export per-cell timings to mutation_timings.csv/.json")
+    parser.add_argument('--profile', type=int, default=0, metavar='N',
+                        help="profile every cell with cProfile and dump the N slowest mutants")
+    parser.add_argument('--memory-report', action='store_true',
+                        help="trace peak and retained memory per mutant and checker instance")
+    parser.add_argument('--memory-ceiling', type=float, metavar='MB',
+                        help="fail the run with a diagnosis if any process exceeds this RSS")
+    parser.add_argument('--generated', type=int, default=0, metavar='N',
+                        help="run N groups per MR generated from the dictionary (seeded by --seed)")
+    parser.add_argument('--compose', action='append', default=[], metavar='MRS',
+                        help="also run a composed MR such as MR1+MR3 (repeatable; needs --generated)")
+    args = parser.parse_args()
+    if args.compose and not args.generated:
+        parser.error("--compose needs --generated: composed MRs have no hand-written groups")
+    
+    if args.report:
+        sys.exit(0 if report_from_journal() else 1)
+    
+    if args.sample:
+        run_sampled_testing(sample_size=args.sample, target_width=args.target_width,
+                            confidence=args.confidence, stratified=not args.no_stratify,
+                            seed=args.seed, workers=args.jobs or default_workers(),
+                            schemata=args.schemata)
+        sys.exit(0)
+    
+    if args.higher_order:
+        run_higher_order_testing(order=args.higher_order, max_mutants=args.budget,
+                                 time_budget=args.time_budget, seed=args.seed,
+                                 workers=args.jobs or default_workers(),
+                                 incremental=args.incremental, prune_store=args.prune_store)
+        sys.exit(0)
+    
+    try:
+        results, score = run_mutation_testing(workers=args.jobs or default_workers(),
+                                              schemata=args.schemata,
+                                              import_times=args.import_times,
+                                              fail_fast=args.fail_fast,
+                                              cache_stats=args.cache_stats,
+                                              incremental=args.incremental,
+                                              prune_store=args.prune_store,
+                                              analytics=args.analytics,
+                                              suite=args.suite,
+                                              minimize_suite=args.minimize,
+                                              dedupe=args.dedupe,
+                                              timeout=args.timeout,
+                                              memory_limit=args.memory_limit,
+                                              resume=args.resume,
+                                              timings=args.timings,
+                                              profile=args.profile,
+                                              memory_report=args.memory_report,
+                                              memory_ceiling=args.memory_ceiling,
+                                              generated=args.generated,
+                                              seed=args.seed,
+                                              compose=args.compose)
+    except MemoryCeilingError as e:
+        print("\nMEMORY CEILING EXCEEDED")
+        print("-" * 80)
+        print(e)
+        sys.exit(1)
\ No newline at end of file
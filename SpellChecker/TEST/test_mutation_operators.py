@@ -0,0 +1,47 @@
+"""
+Unit tests for the AST mutation engine's operator labels and skipped mutants
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from mutation_operators import CallDeletion, IterableSlicing, StatementDeletion, iter_mutants
+
+SOURCE = '''
+def f(words, limit):
+    total = 0
+    total = total + limit
+    words = list(words)
+    kept = [w for w in words]
+    found = {w for w in kept}
+    ordered = [w for w in words]
+    return found, ordered
+'''
+
+
+def mutants(operator):
+    return [(m.original, m.description) for m in iter_mutants(SOURCE, [operator])]
+
+
+def test_call_deletion_has_its_own_label():
+    assert CallDeletion.label != StatementDeletion.label
+
+
+def test_statement_deletion_skips_stillborn_assignments():
+    deleted = [original for original, _ in mutants(StatementDeletion())]
+    # The first `total`, `kept`, `found` and `ordered` are read before any other
+    # binding; the second `total` and `words` are rebinds
+    assert deleted == ['total = total + limit', 'words = list(words)']
+
+
+def test_reversal_skipped_only_where_the_order_cannot_matter():
+    reversed_iterables = [original for original, description in mutants(IterableSlicing())
+                          if description == "Reverse order"]
+    assert reversed_iterables == ['for w in words']
+
+
+def test_known_has_no_stillborn_or_reversal_mutants():
+    # Every assignment in known() is read later and its result is a set
+    descriptions = {mutant.description for mutant in iter_mutants()}
+    assert not descriptions & {"Delete statement", "Reverse order"}
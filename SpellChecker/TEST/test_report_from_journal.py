@@ -0,0 +1,34 @@
+"""
+Unit tests for rebuilding the results report from the journal
+"""
+
+import test_mutation
+from results_journal import Journal
+
+
+def write_journal(path, generated):
+    journal = Journal(path)
+    counts = generated[0] if generated else 7
+    journal.start({'schemata': False, 'fail_fast': False, 'suite': None,
+                   'group_counts': {mr_name: counts for mr_name in ('MR1', 'MR2', 'MR3', 'MR4')},
+                   'dedupe': False, 'generated': generated})
+    for i in range(1, 31):
+        for mr_name in ('MR1', 'MR2', 'MR3', 'MR4'):
+            # Group 9 only exists in the generated suite
+            violations = ['MG9'] if generated and mr_name == 'MR2' and i % 3 == 0 else []
+            journal.cell(i, mr_name, bool(violations), violations)
+    return journal
+
+
+def test_report_of_a_generated_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    journal = write_journal(str(tmp_path / 'journal.jsonl'), [10, 3])
+    mr_results, combined_score = test_mutation.report_from_journal(journal)
+    assert len(mr_results['MR2']['killed']) == 10
+    assert combined_score == 10 / 30 * 100
+
+
+def test_report_of_a_hand_written_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    journal = write_journal(str(tmp_path / 'journal.jsonl'), None)
+    assert test_mutation.report_from_journal(journal)[1] == 0
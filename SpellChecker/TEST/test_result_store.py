@@ -0,0 +1,39 @@
+"""
+Unit tests for the incremental result store
+"""
+
+from result_store import ResultStore
+
+
+def test_save_keeps_cells_of_earlier_runs(tmp_path):
+    path = str(tmp_path / 'store.json')
+    store = ResultStore(path)
+    store.put('a', True, ['MG1'])
+    store.put('b', False, [])
+    store.save()
+
+    # A run over a subset of the cells
+    store = ResultStore(path)
+    assert store.get('a') == (True, ['MG1'])
+    store.put('c', True, ['MG2'])
+    store.save()
+
+    store = ResultStore(path)
+    assert store.get('b') == (False, [])
+    assert store.get('c') == (True, ['MG2'])
+
+
+def test_prune_drops_unused_cells(tmp_path):
+    path = str(tmp_path / 'store.json')
+    store = ResultStore(path)
+    store.put('a', True, ['MG1'])
+    store.put('b', False, [])
+    store.save()
+
+    store = ResultStore(path)
+    store.get('a')
+    store.save(prune=True)
+
+    store = ResultStore(path)
+    assert store.get('a') == (True, ['MG1'])
+    assert store.get('b') is None
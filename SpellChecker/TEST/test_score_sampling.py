@@ -0,0 +1,57 @@
+"""
+Unit tests for stratified score estimation, including a coverage simulation
+"""
+
+import random
+
+import pytest
+
+from score_sampling import MutantSampler, estimate_score, load_strata, merge_strata
+
+
+def test_merge_strata_caps_the_count_and_removes_singletons():
+    strata = {'A': [1], 'B': [2, 3], 'C': [4], 'D': [5, 6, 7, 8, 9], 'E': [10]}
+    merged = merge_strata(strata, max_strata=3)
+    assert len(merged) <= 3
+    assert min(len(nums) for nums in merged.values()) >= 2
+    assert sorted(num for nums in merged.values() for num in nums) == list(range(1, 11))
+
+
+def test_first_round_samples_every_stratum_twice():
+    sampler = MutantSampler(load_strata(), seed=3)
+    batch = sampler.draw(1)
+    assert len(batch) == 2 * len(sampler.strata)
+    for nums in sampler.strata.values():
+        assert len(set(nums) & set(batch)) == 2
+
+
+def test_full_sample_is_exact():
+    strata = {'A': [1, 2, 3], 'B': [4, 5]}
+    kills = {1: True, 2: False, 3: True, 4: True, 5: True}
+    assert estimate_score(strata, kills) == pytest.approx((0.8, 0.8, 0.8))
+
+
+def test_homogeneous_sample_keeps_an_interval():
+    strata = {'A': list(range(10)), 'B': list(range(10, 20))}
+    estimate, lower, upper = estimate_score(strata, {0: True, 1: True, 10: True, 11: True})
+    assert estimate == upper == 1.0
+    assert lower < 0.8
+
+
+@pytest.mark.parametrize('rate', [0.15, 0.5, 0.85])
+@pytest.mark.parametrize('stratified', [True, False])
+def test_interval_coverage_is_near_nominal(rate, stratified):
+    strata = load_strata()
+    rng = random.Random(rate)
+    killed = {num: rng.random() < rate for nums in strata.values() for num in nums}
+    truth = sum(killed.values()) / len(killed)
+
+    trials = 400
+    covered = 0
+    for seed in range(trials):
+        sampler = MutantSampler(strata, stratified, seed)
+        sampler.draw(10)
+        _, lower, upper = estimate_score(sampler.strata, {num: killed[num] for num in sampler.sampled})
+        covered += lower <= truth <= upper
+    # 95% intervals; the slack absorbs simulation noise
+    assert covered / trials >= 0.88
@@ -0,0 +1,31 @@
+"""
+Unit tests for the shared read-only word-frequency store
+"""
+
+import pytest
+from spellchecker import SpellChecker
+
+from shared_dictionary import build_checker, get_shared_word_frequency
+
+
+@pytest.fixture(scope='module')
+def checkers():
+    return SpellChecker(language='en'), build_checker(SpellChecker)
+
+
+@pytest.mark.parametrize('word', ['the', 'hello', 'xyzq', ''])
+def test_lookups_match_the_loaded_dictionary(checkers, word):
+    loaded, shared = checkers
+    assert shared[word] == loaded[word]
+    assert shared.word_frequency[word] == loaded.word_frequency[word]
+    assert shared.word_usage_frequency(word) == loaded.word_usage_frequency(word)
+    assert shared.word_frequency.dictionary.get(word) == loaded.word_frequency.dictionary.get(word)
+
+
+def test_store_is_read_only():
+    store = get_shared_word_frequency()
+    with pytest.raises(TypeError):
+        store.dictionary['xyzq'] = 1
+    with pytest.raises(TypeError):
+        store.add('xyzq')
+    store.assert_unchanged(full=True)
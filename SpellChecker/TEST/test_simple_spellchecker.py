@@ -0,0 +1,62 @@
+"""
+Unit tests for the SimpleSpellChecker extensions of known()
+"""
+
+import os
+import statistics
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'SUT'))
+from import_benchmark import IMPORT_BUDGET_MS, measure
+from simple_spellchecker import SimpleSpellChecker
+
+WORDS = ['hello', 'World', 'asdfgh', 'python', 'the', 'THE', 'xyzabc', 'apple', 'nan', '1.5', '.']
+
+
+@pytest.fixture(scope='module')
+def checker():
+    return SimpleSpellChecker().warm()
+
+
+def test_known_iter_matches_known_on_a_generator(checker):
+    tokens = (WORDS[i % len(WORDS)] for i in range(100))
+    expected = checker.known([WORDS[i % len(WORDS)] for i in range(100)])
+    assert set(checker.known_iter(tokens, chunk_size=3)) == expected
+
+
+def test_known_iter_rejects_empty_chunks(checker):
+    with pytest.raises(ValueError):
+        list(checker.known_iter(WORDS, chunk_size=0))
+
+
+@pytest.mark.parametrize('cache_size', [1, 3, 100_000])
+def test_known_batch_matches_known(checker, cache_size):
+    batched = SimpleSpellChecker(cache_size=cache_size)
+    for batch in (WORDS, WORDS[::-1] * 3, [b'hello', 'Hello', 'zzzq'], []):
+        assert batched.known_batch(batch) == checker.known(batch)
+    assert len(batched.cache) <= cache_size
+
+
+def test_known_batch_counts_every_token():
+    batched = SimpleSpellChecker()
+    batched.known_batch(['the', 'the', 'the', 'cat'])
+    batched.known_batch(['the', 'dog', 'dog'])
+    stats = batched.cache_stats()
+    assert stats['tokens'] == 7
+    assert stats['duplicates'] == 3
+    assert (stats['hits'], stats['misses']) == (4, 3)
+    assert stats['hit_rate'] == pytest.approx(4 / 7)
+
+
+def test_import_is_lazy():
+    # measure() fails if pyspellchecker is imported before the first lookup
+    measure(runs=1)
+
+
+@pytest.mark.skipif(not os.environ.get('IMPORT_BENCHMARK'),
+                    reason="timing depends on the machine; set IMPORT_BENCHMARK=1 to check the budget")
+def test_import_within_budget():
+    times = measure(runs=10)
+    assert statistics.median(times) <= IMPORT_BUDGET_MS
@@ -0,0 +1,157 @@
+"""
+Timing and profiling instrumentation for mutation runs
+Each (mutant, MR) cell records its checker construction time, the time spent
+inside known() and the latency of every test group; together with the mutant
+import times these show whether imports, the dictionary or the MR loops
+dominate. Cells can also run under cProfile to dump the slowest mutants.
+"""
+
+import cProfile
+import csv
+import json
+import os
+import pstats
+import time
+
+TIMINGS_CSV = 'mutation_timings.csv'
+TIMINGS_JSON = 'mutation_timings.json'
+PROFILE_DIR = 'mutation_profiles'
+
+
+class TimedChecker:
+    """Checker proxy that accumulates the time spent in known()"""
+
+    def __init__(self, checker):
+        self.checker = checker
+        self.known_time = 0.0
+        self.known_calls = 0
+
+    def known(self, words):
+        start = time.perf_counter()
+        try:
+            return self.checker.known(words)
+        finally:
+            self.known_time += time.perf_counter() - start
+            self.known_calls += 1
+
+
+def profile_call(func, *args, **kwargs):
+    """Run func under cProfile and return (result, raw stats)
+
+    The raw stats are a plain dict, so they can be sent back from a worker.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    profiler.create_stats()
+    return result, profiler.stats
+
+
+class _RawStats:
+    """Adapter letting pstats.Stats load a raw stats dict"""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+def timing_rows(matrix, import_times):
+    """One row per executed cell of a runner result matrix
+
+    Cells whose results were reused rather than run (incremental store,
+    journal, duplicates) carry no timing and are left out.
+
+    Args:
+        matrix (dict): (mutant_num, mr_name) -> (killed, violations, cache stats, timing)
+        import_times (dict): mutant number -> import time in seconds
+
+    Returns:
+        list: dicts with times in milliseconds
+    """
+    rows = []
+    for (mutant_num, mr_name), result in matrix.items():
+        if len(result) < 4 or not result[3]:
+            continue
+        timing = result[3]
+        import_time = import_times.get(mutant_num)
+        rows.append({
+            'mutant': mutant_num,
+            'mr': mr_name,
+            'import_ms': import_time * 1000 if import_time is not None else None,
+            'checker_ms': timing.get('checker', 0.0) * 1000,
+            'known_ms': timing.get('known', 0.0) * 1000,
+            'known_calls': timing.get('known_calls', 0),
+            'cell_ms': timing['cell'] * 1000,
+            'group_ms': {num: latency * 1000 for num, latency in timing.get('groups', {}).items()},
+        })
+    return rows
+
+
+def write_timings(rows, csv_path=TIMINGS_CSV, json_path=TIMINGS_JSON):
+    """Export timing rows as CSV (one column per group) and JSON"""
+    group_count = max((max(row['group_ms'], default=0) for row in rows), default=0)
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['mutant', 'mr', 'import_ms', 'checker_ms', 'known_ms', 'known_calls', 'cell_ms']
+                        + [f"MG{num}_ms" for num in range(1, group_count + 1)])
+        for row in rows:
+            writer.writerow([f"mutant_{row['mutant']:02d}", row['mr']]
+                            + [_ms(row[key]) for key in ('import_ms', 'checker_ms', 'known_ms')]
+                            + [row['known_calls'], _ms(row['cell_ms'])]
+                            + [_ms(row['group_ms'].get(num)) for num in range(1, group_count + 1)])
+    with open(json_path, 'w') as f:
+        json.dump(rows, f, indent=2)
+        f.write("\n")
+
+
+def _ms(value):
+    return '' if value is None else f"{value:.4f}"
+
+
+def print_summary(rows, import_times):
+    """Print where the time of the executed cells went"""
+    cell = sum(row['cell_ms'] for row in rows)
+    checker = sum(row['checker_ms'] for row in rows)
+    known = sum(row['known_ms'] for row in rows)
+    groups = [latency for row in rows for latency in row['group_ms'].values()]
+    imports = sum(import_times.values()) * 1000
+
+    print("\nTIMING BREAKDOWN")
+    print("-" * 80)
+    print(f"  Mutant imports:        {imports:10.2f} ms ({len(import_times)} mutants)")
+    print(f"  Checker construction:  {checker:10.2f} ms")
+    print(f"  known() calls:         {known:10.2f} ms ({sum(row['known_calls'] for row in rows)} calls)")
+    print(f"  MR loop, bookkeeping:  {cell - checker - known:10.2f} ms")
+    print(f"  Total in cells:        {cell:10.2f} ms ({len(rows)} cells)")
+    if groups:
+        groups.sort()
+        print(f"  Group latency:         median {groups[len(groups) // 2]:.3f} ms, "
+              f"max {groups[-1]:.3f} ms over {len(groups)} groups")
+
+
+def dump_slowest(matrix, top_n, out_dir=PROFILE_DIR):
+    """Write cProfile dumps of the `top_n` slowest mutants and print them
+
+    Each mutant's dump aggregates the profiles of all its cells.
+    """
+    totals = {}
+    stats = {}
+    for (mutant_num, _), result in matrix.items():
+        if len(result) < 4 or not result[3] or 'profile' not in result[3]:
+            continue
+        totals[mutant_num] = totals.get(mutant_num, 0.0) + result[3]['cell']
+        raw = _RawStats(result[3]['profile'])
+        if mutant_num in stats:
+            stats[mutant_num].add(raw)
+        else:
+            stats[mutant_num] = pstats.Stats(raw)
+
+    slowest = sorted(totals, key=totals.get, reverse=True)[:top_n]
+    os.makedirs(out_dir, exist_ok=True)
+    print(f"\nSLOWEST MUTANTS (cProfile, top {top_n})")
+    print("-" * 80)
+    for mutant_num in slowest:
+        path = os.path.join(out_dir, f"mutant_{mutant_num:02d}.prof")
+        stats[mutant_num].dump_stats(path)
+        print(f"  mutant_{mutant_num:02d}: {totals[mutant_num] * 1000:8.2f} ms  -> {path}")
@@ -0,0 +1,132 @@
+"""
+Guaranteed-unknown word synthesis for MR2
+An exact index over the dictionary answers membership for every candidate,
+so synthesized tokens are guaranteed to be rejected by the original known().
+Near misses are one edit (deletion, insertion, substitution or transposition)
+away from a real word; random tokens are plain letter strings.
+
+The index is an exact frozenset rather than a Bloom filter: in CPython a set
+lookup is already a single hash probe, cheaper than the k probes of a
+Python-level Bloom filter, and the shared dictionary is in memory anyway.
+"""
+
+import random
+import string
+import time
+
+from spellchecker import SpellChecker
+
+from shared_dictionary import build_checker, get_shared_word_frequency
+
+LETTERS = string.ascii_lowercase
+
+_INDEXES = {}
+_POOLS = {}
+
+
+class DictionaryIndex:
+    """Exact membership index of the lowercase dictionary words
+
+    Args:
+        words (iterable): Dictionary words
+    """
+
+    def __init__(self, words):
+        self.words = frozenset(w.lower() for w in words)
+
+    def __contains__(self, word):
+        return word.lower() in self.words
+
+    def __len__(self):
+        return len(self.words)
+
+    def is_unknown(self, word):
+        """True if known() of the original checker can never return the word"""
+        return word.lower() not in self.words
+
+
+def dictionary_index(language='en'):
+    """Index over the shared dictionary of `language`, built once per process"""
+    if language not in _INDEXES:
+        _INDEXES[language] = DictionaryIndex(get_shared_word_frequency(language).dictionary)
+    return _INDEXES[language]
+
+
+def word_pool(language='en'):
+    """Sorted dictionary words that the original known() accepts in any case
+
+    Restricted to ASCII letters, so that lower(upper(w)) == w and case
+    variants stay in the dictionary.
+    """
+    if language not in _POOLS:
+        words = get_shared_word_frequency(language).dictionary
+        candidates = [w for w in words if w.isascii() and w.isalpha()]
+        _POOLS[language] = sorted(build_checker(SpellChecker, language).known(candidates))
+    return _POOLS[language]
+
+
+def one_edit(rng, word):
+    """Apply one random deletion, insertion, substitution or transposition"""
+    i = rng.randrange(len(word) + 1)
+    edit = rng.randrange(4) if len(word) > 1 else rng.choice((1, 2))
+    if edit == 0:
+        return word[:i] + word[i + 1:]
+    if edit == 1:
+        return word[:i] + rng.choice(LETTERS) + word[i:]
+    if edit == 2:
+        i = min(i, len(word) - 1)
+        return word[:i] + rng.choice(LETTERS) + word[i + 1:]
+    i = min(i, len(word) - 2)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def near_miss(rng, pool, index, attempts=20):
+    """An unknown token one edit away from a random word of `pool`
+
+    Falls back to a random token if no edit of the drawn words is unknown.
+    """
+    for _ in range(attempts):
+        candidate = one_edit(rng, rng.choice(pool))
+        if len(candidate) > 1 and index.is_unknown(candidate):
+            return candidate
+    return random_unknown(rng, index)
+
+
+def random_unknown(rng, index, length=(5, 10)):
+    """A random lowercase token that is not in the dictionary"""
+    while True:
+        candidate = ''.join(rng.choices(LETTERS, k=rng.randint(*length)))
+        if index.is_unknown(candidate):
+            return candidate
+
+
+def unknown_word(rng, pool, index, near_miss_rate=0.8):
+    """A guaranteed-unknown token, a near miss with probability `near_miss_rate`"""
+    if rng.random() < near_miss_rate:
+        return near_miss(rng, pool, index)
+    return random_unknown(rng, index)
+
+
+def synthesize(count, pool, index=None, seed=0, near_miss_rate=0.8):
+    """Lazily yield `count` guaranteed-unknown tokens (None = without end)"""
+    index = index or dictionary_index()
+    rng = random.Random(seed)
+    produced = 0
+    while count is None or produced < count:
+        yield unknown_word(rng, pool, index, near_miss_rate)
+        produced += 1
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    index = dictionary_index()
+    pool = word_pool()
+    print(f"Index of {len(index)} words built in {time.perf_counter() - start:.2f}s")
+
+    for rate, label in ((1.0, "near misses"), (0.0, "random tokens")):
+        start = time.perf_counter()
+        tokens = list(synthesize(1_000_000, pool, index, near_miss_rate=rate))
+        elapsed = time.perf_counter() - start
+        assert all(index.is_unknown(t) for t in tokens)
+        print(f"1,000,000 {label} in {elapsed:.2f}s ({len(tokens) / elapsed:,.0f}/s), "
+              f"e.g. {', '.join(tokens[:5])}")
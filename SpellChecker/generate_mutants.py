@@ -1,7 +1,16 @@
 """
 Generate 30 mutants for the known() method
+
+Default mode writes one file per mutant into MUTANTS/. Schemata mode instead
+compiles every mutation into a single meta-mutant class whose active mutant
+is selected at runtime by setting `active_mutant` (0 = original known()).
+The ast engine derives mutants from the installed known() source with the
+operators in mutation_operators.py instead of the hand-written list below.
 """
 
+import argparse
+import os
+
 mutant_template = '''"""Mutant {num:02d}: {description}"""
 from spellchecker import SpellChecker
 import typing
@@ -13,6 +22,28 @@ class MutantSpellChecker(SpellChecker):
 {code}
 '''
 
+meta_template = '''"""Meta-mutant: all {count} mutations of known() in one class"""
+from spellchecker import SpellChecker
+import typing
+from spellchecker.utils import KeyT, ensure_unicode
+
+class MetaMutantSpellChecker(SpellChecker):
+    active_mutant = 0
+
+    def known(self, words: typing.Iterable[KeyT]) -> typing.Set[str]:
+        """Dispatch to the known() body of the active mutant"""
+        return _KNOWN_VARIANTS[self.active_mutant](self, words)
+{methods}
+
+_KNOWN_VARIANTS = {{0: SpellChecker.known, {table}}}
+'''
+
+meta_method_template = '''
+    def _known_{num:02d}(self, words: typing.Iterable[KeyT]) -> typing.Set[str]:
+        """Mutant {num:02d}: {description}"""
+{code}
+'''
+
 mutations = [
     # (mutant_num, description, code)
     (1, "Change AND to OR", """        tmp_words = [ensure_unicode(w) for w in words]
@@ -174,14 +205,77 @@ mutations = [
         return {w for w in tmp if w not in self._word_frequency.dictionary}"""),
 ]
 
-# Generate all mutant files
-for num, description, code in mutations:
-    filename = f"MUTANTS/mutant_{num:02d}.py"
-    content = mutant_template.format(num=num, description=description, code=code)
+
+def ast_mutations(mutants):
+    """Convert mutation_operators mutants (first or higher order) to (num, description, code) entries"""
+    for mutant in mutants:
+        code = f"        # MUTATION: {mutant.full_description}\n{mutant.code}"
+        yield mutant.num, mutant.full_description, code
+
+
+def write_mutant_files(entries=None, out_dir="MUTANTS"):
+    """Write one <out_dir>/mutant_XX.py file per mutation
     
-    with open(filename, 'w') as f:
-        f.write(content)
+    Args:
+        entries: (num, description, code) tuples, consumed lazily (default: mutations)
+        out_dir (str): Directory receiving the files
+    """
+    count = 0
+    for num, description, code in (mutations if entries is None else entries):
+        filename = os.path.join(out_dir, f"mutant_{num:02d}.py")
+        content = mutant_template.format(num=num, description=description, code=code)
+        
+        with open(filename, 'w') as f:
+            f.write(content)
+        
+        print(f"Created {filename}")
+        count += 1
     
-    print(f"Created {filename}")
+    print(f"\n✓ All {count} mutants generated successfully!")
+
 
-print("\n✓ All 30 mutants generated successfully!")
\ No newline at end of file
+def meta_mutant_source(entries=None):
+    """Return the source of the meta-mutant module holding every mutation"""
+    entries = mutations if entries is None else list(entries)
+    methods = ''.join(meta_method_template.format(num=num, description=description, code=code)
+                      for num, description, code in entries)
+    table = ', '.join(f"{num}: MetaMutantSpellChecker._known_{num:02d}" for num, _, _ in entries)
+    return meta_template.format(count=len(entries), methods=methods, table=table)
+
+
+def build_meta_mutant(entries=None):
+    """Compile the meta-mutant in memory and return its checker class"""
+    namespace = {'__name__': 'meta_mutant'}
+    exec(compile(meta_mutant_source(entries), '<meta_mutant>', 'exec'), namespace)
+    return namespace['MetaMutantSpellChecker']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate mutants of SpellChecker.known()")
+    parser.add_argument('--schemata', action='store_true',
+                        help="write a single meta_mutant.py instead of one file per mutant")
+    parser.add_argument('--engine', choices=['manual', 'ast'], default='manual',
+                        help="hand-written mutations list, or AST operators applied to the installed known()")
+    parser.add_argument('--output', default=None,
+                        help="output directory (default: MUTANTS for manual, MUTANTS_AST for ast)")
+    args = parser.parse_args()
+    out_dir = args.output or ("MUTANTS_AST" if args.engine == 'ast' else "MUTANTS")
+    os.makedirs(out_dir, exist_ok=True)
+    
+    if args.engine == 'ast':
+        from mutation_operators import iter_mutants, write_csv
+        
+        # One pass produces both the mutant code and the mutants.csv rows
+        generated = write_csv(iter_mutants(), os.path.join(out_dir, "mutants.csv"))
+        entries = list(ast_mutations(generated))
+        print(f"Created {os.path.join(out_dir, 'mutants.csv')} ({len(entries)} mutants)")
+    else:
+        entries = mutations
+    
+    if args.schemata:
+        filename = os.path.join(out_dir, "meta_mutant.py")
+        with open(filename, 'w') as f:
+            f.write(meta_mutant_source(entries))
+        print(f"Created {filename} ({len(entries)} mutants)")
+    else:
+        write_mutant_files(entries, out_dir)
@@ -0,0 +1,529 @@
+"""
+AST-driven mutation operators for SpellChecker.known()
+
+The source of known() is read from the installed pyspellchecker, parsed once,
+and every operator is applied at every matching node as an AST transform.
+First-order mutants are streamed lazily, each carrying the body code that
+fits the templates in generate_mutants.py and its mutants.csv row.
+"""
+
+import ast
+import copy
+import csv
+import inspect
+import itertools
+import random
+import textwrap
+import time
+
+from spellchecker import SpellChecker
+
+
+class MutationOperator:
+    """Base class: returns the replacements of one AST node"""
+
+    name = ""
+    label = ""
+
+    def mutate(self, node):
+        """Return a list of (replacement node, description) for `node`"""
+        return []
+
+    def skip(self, node, description, body):
+        """Whether a replacement is known to be stillborn or equivalent
+
+        `body` is the BodyAnalysis of the function being mutated.
+        """
+        return False
+
+
+class LogicalOperatorReplacement(MutationOperator):
+    name = "LOR"
+    label = "Logical Operator Replacement (LOR)"
+
+    def mutate(self, node):
+        if isinstance(node, ast.BoolOp):
+            if isinstance(node.op, ast.And):
+                return [(ast.BoolOp(op=ast.Or(), values=node.values), "AND → OR")]
+            return [(ast.BoolOp(op=ast.And(), values=node.values), "OR → AND")]
+        return []
+
+
+class RelationalOperatorReplacement(MutationOperator):
+    name = "ROR"
+    label = "Relational Operator Replacement (ROR)"
+
+    SWAPS = {
+        ast.In: [(ast.NotIn, "in → not in")],
+        ast.NotIn: [(ast.In, "not in → in")],
+        ast.Eq: [(ast.NotEq, "== → !=")],
+        ast.NotEq: [(ast.Eq, "!= → ==")],
+        ast.Is: [(ast.IsNot, "is → is not")],
+        ast.IsNot: [(ast.Is, "is not → is")],
+        ast.Lt: [(ast.LtE, "< → <="), (ast.Gt, "< → >")],
+        ast.LtE: [(ast.Lt, "<= → <"), (ast.GtE, "<= → >=")],
+        ast.Gt: [(ast.GtE, "> → >="), (ast.Lt, "> → <")],
+        ast.GtE: [(ast.Gt, ">= → >"), (ast.LtE, ">= → <=")],
+    }
+
+    def mutate(self, node):
+        if not isinstance(node, ast.Compare) or len(node.ops) != 1:
+            return []
+        return [(ast.Compare(left=node.left, ops=[op()], comparators=node.comparators), description)
+                for op, description in self.SWAPS.get(type(node.ops[0]), [])]
+
+
+class ConditionNegation(MutationOperator):
+    name = "LOI"
+    label = "Logical Operator Insertion (LOI)"
+
+    def mutate(self, node):
+        if isinstance(node, ast.IfExp):
+            return [(ast.IfExp(test=ast.UnaryOp(op=ast.Not(), operand=node.test),
+                               body=node.body, orelse=node.orelse), "Negate conditional test")]
+        if isinstance(node, ast.BoolOp):
+            return [(ast.BoolOp(op=node.op, values=node.values[:i] + [ast.UnaryOp(op=ast.Not(), operand=v)]
+                                + node.values[i + 1:]), f"Negate operand {i + 1}")
+                    for i, v in enumerate(node.values)]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return [(node.operand, "Remove NOT")]
+        return []
+
+
+class ConditionalBranchSwap(MutationOperator):
+    name = "CBS"
+    label = "Conditional Branch Swap"
+
+    def mutate(self, node):
+        if isinstance(node, ast.IfExp):
+            return [(ast.IfExp(test=node.test, body=node.orelse, orelse=node.body), "Swap if/else branches")]
+        return []
+
+
+class ConditionalRemoval(MutationOperator):
+    name = "CRM"
+    label = "Conditional Removal"
+
+    def mutate(self, node):
+        if isinstance(node, ast.IfExp):
+            return [(node.body, "Always take the if branch"), (node.orelse, "Always take the else branch")]
+        if isinstance(node, ast.BoolOp):
+            return [(v, f"Keep only operand {i + 1}") for i, v in enumerate(node.values)]
+        return []
+
+
+class FilterReplacement(MutationOperator):
+    name = "FRP"
+    label = "Filter Replacement"
+
+    def mutate(self, node):
+        if not isinstance(node, ast.comprehension):
+            return []
+        mutants = []
+        if node.ifs:
+            mutants.append((ast.comprehension(target=node.target, iter=node.iter, ifs=[],
+                                              is_async=node.is_async), "Remove comprehension filter"))
+            mutants.append((ast.comprehension(target=node.target, iter=node.iter,
+                                              ifs=[ast.Constant(value=False)], is_async=node.is_async),
+                            "Filter always False"))
+        else:
+            truthy = ast.Name(id=node.target.id, ctx=ast.Load()) if isinstance(node.target, ast.Name) else None
+            if truthy is not None:
+                mutants.append((ast.comprehension(target=node.target, iter=node.iter, ifs=[truthy],
+                                                  is_async=node.is_async), "Add truthiness filter"))
+        return mutants
+
+
+class IterableSlicing(MutationOperator):
+    name = "ASL"
+    label = "Array Modification"
+
+    SLICES = [
+        (ast.Slice(lower=ast.Constant(value=1)), "Skip first element"),
+        (ast.Slice(upper=ast.Constant(value=-1)), "Skip last element"),
+        (ast.Slice(step=ast.Constant(value=-1)), "Reverse order"),
+    ]
+    REORDERING = {"Reverse order"}
+
+    def mutate(self, node):
+        if not isinstance(node, ast.comprehension):
+            return []
+        return [(ast.comprehension(target=node.target,
+                                   iter=ast.Subscript(value=ast.Call(func=ast.Name(id='list', ctx=ast.Load()),
+                                                                     args=[node.iter], keywords=[]),
+                                                      slice=copy.deepcopy(s), ctx=ast.Load()),
+                                   ifs=node.ifs, is_async=node.is_async), description)
+                for s, description in self.SLICES]
+
+    def skip(self, node, description, body):
+        # Reordering what ends up in a set cannot change the result
+        return description in self.REORDERING and body.order_insensitive(node)
+
+
+class MethodReplacement(MutationOperator):
+    name = "MTR"
+    label = "Method Replacement"
+
+    SWAPS = {'lower': 'upper', 'upper': 'lower', 'strip': 'lstrip', 'startswith': 'endswith',
+             'endswith': 'startswith'}
+
+    def mutate(self, node):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) \
+                and node.func.attr in self.SWAPS:
+            new = self.SWAPS[node.func.attr]
+            func = ast.Attribute(value=node.func.value, attr=new, ctx=ast.Load())
+            return [(ast.Call(func=func, args=node.args, keywords=node.keywords),
+                     f"{node.func.attr}() → {new}()")]
+        return []
+
+
+class CallDeletion(MutationOperator):
+    name = "CDL"
+    label = "Call Deletion"
+
+    def mutate(self, node):
+        if not isinstance(node, ast.Call) or node.keywords:
+            return []
+        if isinstance(node.func, ast.Attribute) and not node.args:
+            return [(node.func.value, f"Remove .{node.func.attr}() call")]
+        if isinstance(node.func, ast.Name) and len(node.args) == 1:
+            return [(node.args[0], f"Remove {node.func.id}() call")]
+        return []
+
+
+class StatementDeletion(MutationOperator):
+    name = "SDL"
+    label = "Statement Deletion"
+
+    def mutate(self, node):
+        if isinstance(node, (ast.Assign, ast.AugAssign, ast.Expr)):
+            return [(ast.Pass(), "Delete statement")]
+        return []
+
+    def skip(self, node, description, body):
+        # Deleting the only binding of a name read later just raises NameError
+        return isinstance(node, (ast.Assign, ast.AugAssign)) and bool(body.unbound_after_deletion(node))
+
+
+class ReturnReplacement(MutationOperator):
+    name = "RTR"
+    label = "Statement Replacement"
+
+    def mutate(self, node):
+        if isinstance(node, ast.Return) and node.value is not None:
+            empty = ast.Call(func=ast.Name(id='set', ctx=ast.Load()), args=[], keywords=[])
+            return [(ast.Return(value=empty), "Return empty set")]
+        return []
+
+
+class ConstantReplacement(MutationOperator):
+    name = "CRP"
+    label = "Constant Replacement"
+
+    def mutate(self, node):
+        if not isinstance(node, ast.Constant):
+            return []
+        value = node.value
+        if isinstance(value, bool):
+            return [(ast.Constant(value=not value), f"{value} → {not value}")]
+        if isinstance(value, int):
+            return [(ast.Constant(value=v), f"{value} → {v}") for v in sorted({0, 1, value + 1, value - 1} - {value})]
+        if isinstance(value, str) and value:
+            return [(ast.Constant(value=''), f"{value!r} → ''")]
+        return []
+
+
+OPERATORS = [
+    LogicalOperatorReplacement(),
+    RelationalOperatorReplacement(),
+    ConditionNegation(),
+    ConditionalBranchSwap(),
+    ConditionalRemoval(),
+    FilterReplacement(),
+    IterableSlicing(),
+    MethodReplacement(),
+    CallDeletion(),
+    StatementDeletion(),
+    ReturnReplacement(),
+    ConstantReplacement(),
+]
+
+
+class Mutant:
+    """One first-order mutant of a function body
+
+    `index` is the pre-order position of the mutated node and `span` the
+    (start, end) range of positions covered by its subtree.
+    """
+
+    def __init__(self, num, operator, description, original, modified, code,
+                 index=None, span=None, replacement=None):
+        self.num = num
+        self.operator = operator
+        self.description = description
+        self.original = original
+        self.modified = modified
+        self.code = code
+        self.index = index
+        self.span = span
+        self.replacement = replacement
+        self.parts = [num]
+
+    @property
+    def mutant_id(self):
+        return f"mutant_{self.num:02d}"
+
+    @property
+    def full_description(self):
+        return f"{self.operator.label}: {self.description}"
+
+    def csv_row(self):
+        """Row for mutants.csv"""
+        return [self.mutant_id, self.original, self.full_description, self.modified]
+
+
+class HigherOrderMutant:
+    """Combination of first-order mutants applied at non-overlapping nodes"""
+
+    def __init__(self, num, parts, code):
+        self.num = num
+        self.parts = [m.num for m in parts]
+        self.full_description = ' + '.join(f"[{m.num:02d}] {m.full_description}" for m in parts)
+        self.code = code
+
+    @property
+    def mutant_id(self):
+        return f"mutant_{self.num:02d}"
+
+
+def _children(node):
+    """Child nodes in the order ast.NodeTransformer visits them"""
+    for _, value in ast.iter_fields(node):
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, ast.AST):
+                    yield item
+        elif isinstance(value, ast.AST):
+            yield value
+
+
+def _preorder(node):
+    yield node
+    for child in _children(node):
+        yield from _preorder(child)
+
+
+class _NodeReplacer(ast.NodeTransformer):
+    """Replace the nodes at given pre-order indices"""
+
+    def __init__(self, replacements):
+        self.replacements = replacements
+        self.index = -1
+
+    def visit(self, node):
+        self.index += 1
+        if self.index in self.replacements:
+            replacement = self.replacements[self.index]
+            # The replaced subtree is not visited, so skip past its indices
+            self.index += sum(1 for _ in _preorder(node)) - 1
+            return replacement
+        return self.generic_visit(node)
+
+
+class BodyAnalysis:
+    """Def-use facts about a function body, used to skip useless mutants
+
+    Args:
+        module (ast.Module): Body from function_body()
+        parameters (iterable): Parameter names of the function
+    """
+
+    def __init__(self, module, parameters=()):
+        self.nodes = list(_preorder(module))
+        self.parameters = set(parameters)
+        self._position = {id(node): i for i, node in enumerate(self.nodes)}
+        self._parent = {}
+        for node in self.nodes:
+            for child in _children(node):
+                self._parent[id(child)] = node
+
+    def _span(self, node):
+        index = self._position[id(node)]
+        return index, index + sum(1 for _ in _preorder(node))
+
+    def _names(self, ctx, start=0, end=None):
+        """Name nodes with context `ctx` at pre-order positions [start, end)"""
+        return [n for n in self.nodes[start:end] if isinstance(n, ast.Name) and isinstance(n.ctx, ctx)]
+
+    def unbound_after_deletion(self, statement):
+        """Names assigned by `statement` that would be read unbound without it"""
+        targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+        assigned = {n.id for t in targets for n in _preorder(t) if isinstance(n, ast.Name)}
+        start, end = self._span(statement)
+        bound = self.parameters | {n.id for n in self._names(ast.Store, end=start)}
+        return {n.id for n in self._names(ast.Load, start=end)} & (assigned - bound)
+
+    def order_insensitive(self, generator):
+        """Whether the iteration order of a comprehension cannot affect the result
+
+        True when the comprehension builds a set, or builds a list or
+        generator that is passed to set()/frozenset(), or is assigned to a
+        name that is only iterated by such order-insensitive comprehensions.
+        """
+        comprehension = self._parent.get(id(generator))
+        if isinstance(comprehension, ast.SetComp):
+            return True
+        if not isinstance(comprehension, (ast.ListComp, ast.GeneratorExp)):
+            return False
+        consumer = self._parent.get(id(comprehension))
+        if isinstance(consumer, ast.Call) and isinstance(consumer.func, ast.Name) \
+                and consumer.func.id in ('set', 'frozenset') and consumer.args == [comprehension]:
+            return True
+        if not (isinstance(consumer, ast.Assign) and len(consumer.targets) == 1
+                and isinstance(consumer.targets[0], ast.Name)):
+            return False
+        name = consumer.targets[0].id
+        uses = [n for n in self._names(ast.Load, start=self._span(consumer)[1]) if n.id == name]
+        for use in uses:
+            iterated_by = self._parent.get(id(use))
+            if not (isinstance(iterated_by, ast.comprehension) and iterated_by.iter is use
+                    and self.order_insensitive(iterated_by)):
+                return False
+        return bool(uses)
+
+
+def known_source():
+    """Dedented source of SpellChecker.known from the installed pyspellchecker"""
+    return textwrap.dedent(inspect.getsource(SpellChecker.known))
+
+
+def function_body(source):
+    """Parse a function's source and return its body statements without docstring"""
+    func = ast.parse(source).body[0]
+    body = func.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        body = body[1:]
+    return ast.Module(body=body, type_ignores=[])
+
+
+def function_parameters(source):
+    """Names of the parameters of the function in `source`"""
+    args = ast.parse(source).body[0].args
+    named = args.posonlyargs + args.args + args.kwonlyargs + [a for a in (args.vararg, args.kwarg) if a]
+    return [a.arg for a in named]
+
+
+def body_code(module, indent=8):
+    """Render body statements at the indentation used by the mutant templates"""
+    return textwrap.indent(ast.unparse(module), ' ' * indent)
+
+
+def _code_of(node):
+    if isinstance(node, ast.comprehension):
+        text = f"for {ast.unparse(node.target)} in {ast.unparse(node.iter)}"
+        return text + ''.join(f" if {ast.unparse(cond)}" for cond in node.ifs)
+    return ast.unparse(node)
+
+
+def iter_mutants(source=None, operators=None, start=1):
+    """Lazily yield every first-order Mutant of a function's body
+
+    Replacements an operator knows to be stillborn or equivalent (see
+    MutationOperator.skip) are not yielded.
+
+    Args:
+        source (str): Function source (default: SpellChecker.known)
+        operators (list): Operator instances to apply (default: OPERATORS)
+        start (int): Number given to the first mutant
+    """
+    source = source or known_source()
+    module = function_body(source)
+    body = BodyAnalysis(module, function_parameters(source))
+    operators = OPERATORS if operators is None else operators
+    num = start
+    for index, node in enumerate(_preorder(module)):
+        span = (index, index + sum(1 for _ in _preorder(node)))
+        for operator in operators:
+            for replacement, description in operator.mutate(node):
+                if operator.skip(node, description, body):
+                    continue
+                mutated = _NodeReplacer({index: replacement}).visit(copy.deepcopy(module))
+                ast.fix_missing_locations(mutated)
+                yield Mutant(num, operator, description, _code_of(node), _code_of(replacement),
+                             body_code(mutated), index, span, replacement)
+                num += 1
+
+
+def _overlaps(a, b):
+    return a.span[0] < b.span[1] and b.span[0] < a.span[1]
+
+
+def iter_higher_order(first_order, order=2, max_mutants=None, time_budget=None, seed=0,
+                      source=None, start=None):
+    """Lazily sample k-order mutants combining `order` first-order mutants
+
+    Combinations are drawn at random without repetition and only kept when
+    the mutated nodes do not overlap. Sampling stops when `max_mutants`
+    have been produced, `time_budget` seconds have passed, or no new
+    combination turns up after many draws.
+
+    Args:
+        first_order (list): Mutants from iter_mutants() of the same source
+        order (int): Number of first-order mutants combined
+        max_mutants (int): Count budget (None = no count limit)
+        time_budget (float): Time budget in seconds (None = no time limit)
+        seed (int): Random seed for reproducible sampling
+        source (str): Function source the first-order mutants came from
+        start (int): Number of the first higher-order mutant (default: after first_order)
+    """
+    module = function_body(source or known_source())
+    rng = random.Random(seed)
+    num = start if start is not None else max(m.num for m in first_order) + 1
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    seen = set()
+    produced = 0
+    misses = 0
+    max_misses = 1000
+
+    if len(first_order) < order:
+        return
+    while misses < max_misses:
+        if max_mutants is not None and produced >= max_mutants:
+            return
+        if deadline is not None and time.perf_counter() >= deadline:
+            return
+        combo = tuple(sorted(rng.sample(range(len(first_order)), order)))
+        parts = [first_order[i] for i in combo]
+        if combo in seen or any(_overlaps(a, b) for a, b in itertools.combinations(parts, 2)):
+            seen.add(combo)
+            misses += 1
+            continue
+        seen.add(combo)
+        misses = 0
+        mutated = _NodeReplacer({m.index: m.replacement for m in parts}).visit(copy.deepcopy(module))
+        ast.fix_missing_locations(mutated)
+        yield HigherOrderMutant(num, parts, body_code(mutated))
+        num += 1
+        produced += 1
+
+
+def write_csv(mutants, path):
+    """Write mutants.csv rows for `mutants` and return them as a list"""
+    mutants = list(mutants)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Mutant ID", "Original Code", "Mutation Operator", "Modified Code"])
+        for mutant in mutants:
+            writer.writerow(mutant.csv_row())
+    return mutants
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    count = 0
+    for mutant in iter_mutants():
+        compile(f"class MutantSpellChecker:\n    def known(self, words):\n{mutant.code}\n", mutant.mutant_id, 'exec')
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"Generated and compiled {count} first-order mutants of known() in {elapsed * 1000:.1f} ms")